@@ -0,0 +1,394 @@
+# archive.py
+"""
+원문 스냅샷과 생성 결과를 보관하는 추가 전용(append-only) 압축 아카이브.
+
+디렉터리 구조:
+    <ARCHIVE_DIR>/segment-000001.seg   레코드별로 압축된 바이트를 이어 붙인 세그먼트 파일
+    <ARCHIVE_DIR>/index.jsonl          레코드 위치(세그먼트, 오프셋, 길이)와 메타데이터 색인
+    <ARCHIVE_DIR>/archive.lock         여러 프로세스의 동시 추가를 막는 잠금 파일
+
+레코드는 하나씩 독립적으로 압축(zstandard가 설치되어 있으면 zstd, 없으면 gzip)되므로
+색인만 있으면 mmap으로 해당 구간만 읽어 임의 접근할 수 있습니다.
+
+사용 예:
+    python -m app.archive list --kind corpus
+    python -m app.archive show 000001-1024
+    python -m app.archive resummarize 000001-1024 --language en
+"""
+import argparse
+import errno
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.config import get_settings
+
+try:
+    import fcntl
+except ImportError:  # POSIX가 아닌 환경(Windows 등)에서는 프로세스 간 잠금 없이 기록합니다.
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 세그먼트 파일 최대 크기 (초과하면 새 세그먼트를 엽니다)
+MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+INDEX_FILENAME = "index.jsonl"
+LOCK_FILENAME = "archive.lock"
+
+# 레코드 종류
+KIND_API_RESPONSE = "api_response"   # data.go.kr API 원본 JSON
+KIND_SCRAPE_HTML = "scrape_html"     # 북한정보포털 원본 HTML
+KIND_CORPUS = "corpus"               # 병합된 원문 텍스트 (스냅샷)
+KIND_PROMPT = "prompt"               # 모델에 보낸 메시지
+KIND_COMPLETION = "completion"       # 모델 응답 원문
+KIND_ARTICLE = "article"             # 최종 제목/본문/이미지 URL
+
+# 한 번의 수집 실행에 속한 레코드를 묶는 실행 ID
+_current_run_id: ContextVar[Optional[str]] = ContextVar("archive_run_id", default=None)
+# deferred_records() 블록 안에서 바로 기록하지 않고 모아 두는 레코드 (종류, 데이터, 키, 메타데이터, 실행 ID)
+PendingRecord = Tuple[str, bytes, str, Optional[Dict[str, Any]], Optional[str]]
+_pending_records: ContextVar[Optional[List[PendingRecord]]] = ContextVar("archive_pending_records", default=None)
+
+
+def compute_content_hash(text: str) -> str:
+    """수집된 원문 텍스트의 SHA-256 해시를 반환합니다. (스냅샷 해시, 아카이브 키로 사용)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _zstd():
+    """zstandard는 선택 의존성입니다. 설치되어 있지 않으면 None을 반환합니다."""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def _compress(data: bytes) -> Tuple[bytes, str]:
+    zstd = _zstd()
+    if zstd:
+        return zstd.ZstdCompressor(level=6).compress(data), "zstd"
+    return gzip.compress(data, compresslevel=6), "gzip"
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        zstd = _zstd()
+        if not zstd:
+            raise RuntimeError("zstd로 압축된 레코드를 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstd.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class Archive:
+    """세그먼트 파일과 색인으로 구성된 추가 전용 아카이브"""
+
+    def __init__(self, directory: str, max_segment_bytes: int = MAX_SEGMENT_BYTES):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._entries: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._keys: set = set()
+        self._index_position = 0
+        self._maps: Dict[str, mmap.mmap] = {}
+
+    # -----------------------------
+    # 쓰기
+    # -----------------------------
+    @contextmanager
+    def _process_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, LOCK_FILENAME), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"segment-{number:06d}.seg")
+
+    def _writable_segment(self, incoming: int) -> int:
+        numbers = sorted(
+            int(name[len("segment-"):-len(".seg")])
+            for name in os.listdir(self.directory)
+            if name.startswith("segment-") and name.endswith(".seg")
+        )
+        number = numbers[-1] if numbers else 1
+        path = self._segment_path(number)
+        if os.path.exists(path) and os.path.getsize(path) + incoming > self.max_segment_bytes:
+            number += 1
+        return number
+
+    def append(
+        self,
+        kind: str,
+        payload: bytes,
+        key: str = "",
+        meta: Optional[Dict[str, Any]] = None,
+        run_id: Optional[str] = None
+    ) -> str:
+        """레코드를 압축하여 세그먼트 끝에 추가하고 레코드 ID를 반환합니다."""
+        compressed, codec = _compress(payload)
+        with self._lock, self._process_lock():
+            number = self._writable_segment(len(compressed))
+            path = self._segment_path(number)
+            with open(path, "ab") as segment:
+                offset = segment.tell()
+                segment.write(compressed)
+            entry = {
+                "id": f"{number:06d}-{offset}",
+                "kind": kind,
+                "key": key,
+                "run_id": run_id or _current_run_id.get(),
+                "segment": os.path.basename(path),
+                "offset": offset,
+                "length": len(compressed),
+                "size": len(payload),
+                "codec": codec,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "meta": meta or {},
+            }
+            with open(self.index_path, "a", encoding="utf-8") as index:
+                index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return entry["id"]
+
+    # -----------------------------
+    # 읽기
+    # -----------------------------
+    def _refresh_index(self) -> None:
+        """다른 프로세스가 추가한 색인 줄까지 읽어 들입니다."""
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "r", encoding="utf-8") as index:
+            index.seek(self._index_position)
+            for line in index:
+                if not line.endswith("\n"):
+                    break  # 아직 쓰는 중인 줄
+                entry = json.loads(line)
+                self._entries.append(entry)
+                self._by_id[entry["id"]] = entry
+                self._keys.add((entry["kind"], entry["key"]))
+                self._index_position += len(line.encode("utf-8"))
+
+    def entries(self, kind: Optional[str] = None, key: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh_index()
+            return [
+                entry for entry in self._entries
+                if (kind is None or entry["kind"] == kind) and (key is None or entry["key"] == key)
+            ]
+
+    def contains(self, kind: str, key: str) -> bool:
+        """같은 종류와 키의 레코드가 이미 있는지 확인합니다."""
+        with self._lock:
+            self._refresh_index()
+            return (kind, key) in self._keys
+
+    def get_entry(self, record_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._refresh_index()
+            return self._by_id.get(record_id)
+
+    def _segment_map(self, segment: str, end: int) -> mmap.mmap:
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            with open(os.path.join(self.directory, segment), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def read(self, record_id: str) -> bytes:
+        """레코드의 원본 바이트를 반환합니다. (세그먼트를 mmap으로 임의 접근)"""
+        entry = self.get_entry(record_id)
+        if entry is None:
+            raise KeyError(f"아카이브 레코드를 찾을 수 없습니다: {record_id}")
+        end = entry["offset"] + entry["length"]
+        with self._lock:
+            compressed = self._segment_map(entry["segment"], end)[entry["offset"]:end]
+        return _decompress(compressed, entry["codec"])
+
+    def read_text(self, record_id: str) -> str:
+        return self.read(record_id).decode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def get_archive() -> Optional[Archive]:
+    """아카이브를 처음 사용할 때 생성합니다. ARCHIVE_ENABLED가 꺼져 있으면 None을 반환합니다."""
+    settings = get_settings()
+    if not settings.archive_enabled:
+        return None
+    return Archive(settings.archive_dir)
+
+
+_disk_full = False
+
+
+def _encode(payload: Any) -> bytes:
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _append(
+    archive: Archive,
+    kind: str,
+    data: bytes,
+    key: str,
+    meta: Optional[Dict[str, Any]],
+    run_id: Optional[str] = None
+) -> Optional[str]:
+    """
+    아카이브 기록 실패가 파이프라인을 멈추지 않도록 예외는 로그로만 남기고 None을 반환합니다.
+    디스크가 가득 차면 오류를 남기고 이 프로세스에서는 더 이상 기록하지 않습니다.
+    """
+    global _disk_full
+    if _disk_full:
+        return None
+    try:
+        return archive.append(kind, data, key=key, meta=meta, run_id=run_id)
+    except OSError as e:
+        if e.errno == errno.ENOSPC:
+            _disk_full = True
+            logger.error(f"❌ 디스크 공간 부족으로 아카이브 기록을 중단합니다. ({archive.directory}) 공간을 확보한 뒤 재시작하세요.")
+        else:
+            logger.error(f"❌ 아카이브 기록 실패 ({kind}): {e}")
+    except Exception as e:
+        logger.error(f"❌ 아카이브 기록 실패 ({kind}): {e}")
+    return None
+
+
+def archive_record(kind: str, payload: Any, key: str = "", meta: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    레코드를 아카이브에 남깁니다. deferred_records() 블록 안에서는 바로 기록하지 않고 모아 둡니다.
+    기록 실패는 로그로만 남기고 None을 반환합니다.
+    """
+    archive = get_archive()
+    if archive is None:
+        return None
+    try:
+        data = _encode(payload)
+    except Exception as e:
+        logger.error(f"❌ 아카이브 기록 실패 ({kind}): {e}")
+        return None
+    pending = _pending_records.get()
+    if pending is not None:
+        pending.append((kind, data, key, meta, _current_run_id.get()))
+        return None
+    return _append(archive, kind, data, key, meta)
+
+
+def archive_contains(kind: str, key: str) -> bool:
+    """같은 종류와 키의 레코드가 이미 보관되어 있는지 확인합니다. (아카이브가 꺼져 있으면 False)"""
+    archive = get_archive()
+    if archive is None:
+        return False
+    try:
+        return archive.contains(kind, key)
+    except Exception as e:
+        logger.error(f"❌ 아카이브 색인 조회 실패: {e}")
+        return False
+
+
+@contextmanager
+def deferred_records() -> Iterator[List[PendingRecord]]:
+    """
+    블록 안의 archive_record 호출을 바로 기록하지 않고 목록에 모아 둡니다.
+    모아 둔 레코드는 flush_records로 기록하거나, 기록할 필요가 없으면 버립니다.
+    """
+    pending: List[PendingRecord] = []
+    token = _pending_records.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending_records.reset(token)
+
+
+def flush_records(pending: List[PendingRecord]) -> None:
+    """deferred_records()로 모아 둔 레코드를 기록합니다."""
+    archive = get_archive()
+    if archive is None:
+        return
+    for kind, data, key, meta, run_id in pending:
+        _append(archive, kind, data, key, meta, run_id)
+
+
+@contextmanager
+def archive_run() -> Iterator[str]:
+    """블록 안에서 기록되는 레코드를 하나의 실행 ID로 묶습니다."""
+    run_id = uuid.uuid4().hex[:12]
+    token = _current_run_id.set(run_id)
+    try:
+        yield run_id
+    finally:
+        _current_run_id.reset(token)
+
+
+# -----------------------------
+# 오프라인 조회 / 재요약 CLI
+# -----------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    from app.config import configure_logging
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="아카이브 조회 및 오프라인 재요약")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="레코드 목록 출력")
+    list_parser.add_argument("--kind")
+    list_parser.add_argument("--key")
+    list_parser.add_argument("--run-id")
+
+    show_parser = subparsers.add_parser("show", help="레코드 내용 출력")
+    show_parser.add_argument("record_id")
+
+    resummarize_parser = subparsers.add_parser("resummarize", help="보관된 원문(corpus)으로 기사를 다시 생성")
+    resummarize_parser.add_argument("record_id")
+    resummarize_parser.add_argument("--language", default="ko")
+    resummarize_parser.add_argument("--purpose", default="backfill")
+
+    args = parser.parse_args(argv)
+    archive = Archive(get_settings().archive_dir)
+
+    if args.command == "list":
+        for entry in archive.entries(kind=args.kind, key=args.key):
+            if args.run_id and entry["run_id"] != args.run_id:
+                continue
+            print(f"{entry['id']}\t{entry['created_at']}\t{entry['kind']}\t{entry['key']}\t{entry['size']}B\trun={entry['run_id']}")
+    elif args.command == "show":
+        print(archive.read_text(args.record_id))
+    elif args.command == "resummarize":
+        from app.summarizer import summarize_and_generate_image
+
+        entry = archive.get_entry(args.record_id)
+        if not entry or entry["kind"] != KIND_CORPUS:
+            parser.error("resummarize에는 corpus 레코드 ID가 필요합니다.")
+        title, summary_html, image_url = summarize_and_generate_image(
+            archive.read_text(args.record_id), language=args.language, purpose=args.purpose
+        )
+        print(json.dumps({"title": title, "summary": summary_html, "image_url": image_url}, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,22 +1,27 @@
 import logging
 import requests
-import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+from app.config import get_settings
+
 logger = logging.getLogger(__name__)
 
-# 환경 변수에서 Tistory 정보 불러오기
-TISTORY_COOKIE = os.environ.get("TISTORY_COOKIE")
-TISTORY_BLOG_NAME = os.environ.get("TISTORY_BLOG_NAME")
+
+@lru_cache(maxsize=1)
+def get_upload_session() -> requests.Session:
+    """업로드 전용 HTTP 세션을 처음 사용할 때 생성합니다."""
+    return requests.Session()
 
 def upload_to_tistory(
     title: str,
     content: str,
     language_code: str,
     category_map: Dict[str, int],
-    visibility: int = 20
+    visibility: int = 20,
+    blog_name: Optional[str] = None,
+    cookie: Optional[str] = None,
+    session: Optional[requests.Session] = None
 ) -> Optional[str]:
     """
     Tistory 블로그에 게시글을 쿠키 기반으로 업로드합니다.
@@ -26,14 +31,28 @@ def upload_to_tistory(
     :param language_code: 글을 작성한 언어 코드 (예: 'ko', 'en')
     :param category_map: 언어 코드와 카테고리 ID를 매핑하는 딕셔너리
     :param visibility: 20 = 발행, 0 = 비공개, 1 = 보호, 2 = 친구 공개
+    :param blog_name: 업로드할 블로그 주소 (cookie와 함께 지정하지 않으면 TISTORY_BLOG_NAME)
+    :param cookie: 해당 블로그의 로그인 쿠키 (blog_name과 함께 지정하지 않으면 TISTORY_COOKIE)
+    :param session: 사용할 HTTP 세션 (기본값: 공용 업로드 세션)
     :return: 업로드된 글의 URL (성공 시) 또는 None (실패 시)
     """
     logger.info("🛠 업로드 함수 호출됨")
 
-    if not TISTORY_COOKIE or not TISTORY_BLOG_NAME:
-        error_msg = "환경 변수 TISTORY_COOKIE 또는 TISTORY_BLOG_NAME이 누락되었습니다."
-        logger.error(f"❌ {error_msg}")
-        raise ValueError(error_msg)
+    # 블로그와 쿠키를 모두 지정하지 않은 경우에만 환경 변수의 기본 블로그를 사용합니다.
+    # (다른 블로그 주소로 기본 블로그의 쿠키가 전송되지 않도록 섞어 쓰지 않습니다)
+    if blog_name is None and cookie is None:
+        settings = get_settings()
+        tistory_cookie = settings.tistory_cookie
+        tistory_blog_name = settings.tistory_blog_name
+        missing_msg = "환경 변수 TISTORY_COOKIE 또는 TISTORY_BLOG_NAME이 누락되었습니다."
+    else:
+        tistory_cookie = cookie
+        tistory_blog_name = blog_name
+        missing_msg = f"Tistory 대상 '{blog_name}'의 blog_name 또는 cookie가 누락되었습니다."
+
+    if not tistory_cookie or not tistory_blog_name:
+        logger.error(f"❌ {missing_msg}")
+        raise ValueError(missing_msg)
 
     # language_code를 기반으로 카테고리 ID 가져오기
     category_id = category_map.get(language_code)
@@ -42,16 +61,16 @@ def upload_to_tistory(
         logger.error(f"❌ {error_msg}")
         raise ValueError(error_msg)
 
-    url = f"https://{TISTORY_BLOG_NAME}/manage/post.json"
+    url = f"https://{tistory_blog_name}/manage/post.json"
     logger.info(f"🌐 요청 URL: {url}")
 
     headers = {
-        "Host": TISTORY_BLOG_NAME,
-        "Cookie": TISTORY_COOKIE,
+        "Host": tistory_blog_name,
+        "Cookie": tistory_cookie,
         "User-Agent": "Mozilla/5.0",
         "Content-Type": "application/json;charset=UTF-8",
-        "Referer": f"https://{TISTORY_BLOG_NAME}/manage/newpost/",
-        "Origin": f"https://{TISTORY_BLOG_NAME}",
+        "Referer": f"https://{tistory_blog_name}/manage/newpost/",
+        "Origin": f"https://{tistory_blog_name}",
         "Accept": "application/json, text/plain, */*"
     }
     
@@ -79,7 +98,7 @@ def upload_to_tistory(
 
     try:
         logger.info("📤 POST 요청 전송 중...")
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = (session or get_upload_session()).post(url, headers=headers, json=data, timeout=30)
         logger.info(f"📥 응답 수신: 상태 코드 {response.status_code}")
 
         response.raise_for_status()
@@ -0,0 +1,183 @@
+# change_poller.py
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from app.circuit_breaker import CircuitOpenError
+from app.config import get_settings
+from app.fetcher import (
+    API_ENDPOINTS,
+    UNIKOREA_SOURCE_NAME,
+    UNIKOREA_TREND_LIST_URL,
+    build_api_params,
+    get_collection_date_range,
+    guarded_get,
+)
+
+logger = logging.getLogger(__name__)
+
+# 북한정보포털 목록에서 지문(fingerprint)을 계산할 상위 행 수
+LIST_ROWS_TO_HASH = 10
+
+# API totalCount를 세는 기간의 시작일(anchor)을 유지하는 최대 일수.
+# 기간 시작일을 고정해 두어야 자정에 수집 기간이 밀려도 항목 수가 바뀌지 않습니다.
+MAX_ANCHOR_DAYS = 7
+
+
+def _extract_total_count(data: Dict[str, Any]) -> Optional[int]:
+    """data.go.kr 응답에서 totalCount를 찾습니다. (최상위 또는 response.body 아래)"""
+    body = data.get("response", {}).get("body", {}) if isinstance(data.get("response"), dict) else {}
+    for container in (data, body):
+        if isinstance(container, dict) and "totalCount" in container:
+            try:
+                return int(container["totalCount"])
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+class ChangePoller:
+    """
+    각 출처의 가벼운 지문을 확인하여 새 콘텐츠가 생겼는지 판단합니다.
+
+    * data.go.kr API: numOfRows=1로 요청하여 고정된 시작일(anchor)부터 오늘까지의 totalCount만 비교
+    * 북한정보포털 목록: ETag/Last-Modified 조건부 요청, 변경 시 상위 행의 해시 비교
+    """
+
+    def __init__(self, state_path: Optional[str] = None):
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._loaded_mtime: Optional[float] = None
+        self.state: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            mtime = os.path.getmtime(self.state_path)
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self._loaded_mtime = mtime
+            return state
+        except Exception as e:
+            logger.error(f"❌ 폴러 상태 파일 로드 실패: {e}")
+            return {}
+
+    def _reload_if_changed(self) -> None:
+        """다른 워커가 폴링하며 상태 파일을 갱신했으면 다시 읽습니다. (이미 처리한 변경을 다시 보고하지 않도록)"""
+        if self.state_path and os.path.exists(self.state_path) and os.path.getmtime(self.state_path) != self._loaded_mtime:
+            self.state = self._load()
+
+    def _save(self) -> None:
+        if not self.state_path:
+            return
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+        self._loaded_mtime = os.path.getmtime(self.state_path)
+
+    # -----------------------------
+    # 출처별 지문
+    # -----------------------------
+    def _api_fingerprint(self, api_name: str, api_config: Dict[str, Any], previous: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        start_date, end_date = get_collection_date_range(3)
+        anchor = previous.get("anchor")
+        rebased = not anchor or (
+            datetime.strptime(end_date, "%Y%m%d") - datetime.strptime(anchor, "%Y%m%d")
+        ).days > MAX_ANCHOR_DAYS
+        if rebased:
+            anchor = start_date
+        params = build_api_params(api_config, anchor, end_date, max_items=1)
+        if params is None:
+            return None
+        response = guarded_get(api_name, api_config["url"], params=params)
+        data = response.json()
+        total_count = _extract_total_count(data)
+        if total_count is None:
+            # totalCount가 없으면 첫 항목의 해시로 대신합니다.
+            items = data.get("items", [])
+            return {"value": hashlib.sha256(json.dumps(items[:1], sort_keys=True).encode("utf-8")).hexdigest()}
+        # 시작일을 새로 잡은 경우 항목 수가 줄어드는 것은 새 콘텐츠가 아니므로 rebased로 표시합니다.
+        return {"value": str(total_count), "anchor": anchor, "rebased": rebased}
+
+    def _list_fingerprint(self, previous: Dict[str, Any]) -> Dict[str, Any]:
+        headers = {}
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+        response = guarded_get(UNIKOREA_SOURCE_NAME, UNIKOREA_TREND_LIST_URL, headers=headers)
+        if response.status_code == 304:
+            return dict(previous)
+
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        rows = soup.select("table tbody tr")[:LIST_ROWS_TO_HASH]
+        digest = hashlib.sha256("\n".join(row.get_text(" ", strip=True) for row in rows).encode("utf-8")).hexdigest()
+        return {
+            "value": digest,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+    # -----------------------------
+    # 폴링
+    # -----------------------------
+    def poll(self) -> List[str]:
+        """
+        모든 출처의 지문을 확인하고 바뀐 출처 이름 목록을 반환합니다.
+        처음 확인하는 출처도 바뀐 것으로 간주합니다. 확인에 실패한 출처는 건너뜁니다.
+        """
+        with self._lock:
+            self._reload_if_changed()
+            changed: List[str] = []
+            probes = {
+                name: (lambda n=name, c=config: self._api_fingerprint(n, c, self.state.get(n, {})))
+                for name, config in API_ENDPOINTS.items()
+            }
+            probes[UNIKOREA_SOURCE_NAME] = lambda: self._list_fingerprint(self.state.get(UNIKOREA_SOURCE_NAME, {}))
+
+            for source, probe in probes.items():
+                try:
+                    fingerprint = probe()
+                except (CircuitOpenError, requests.exceptions.RequestException, ValueError) as e:
+                    logger.warning(f"⚠️ '{source}' 변경 확인 실패: {e}")
+                    continue
+                if fingerprint is None:
+                    continue
+
+                previous = self.state.get(source, {})
+                rebased = fingerprint.pop("rebased", False) and bool(previous)
+                if previous.get("value") != fingerprint["value"] and not rebased:
+                    changed.append(source)
+                    logger.info(f"🆕 '{source}' 새 콘텐츠 감지")
+                fingerprint["checked_at"] = datetime.now().isoformat(timespec="seconds")
+                self.state[source] = fingerprint
+
+            self._save()
+            if not changed:
+                logger.info("💤 모든 출처 변경 없음")
+            return changed
+
+
+@lru_cache(maxsize=1)
+def get_change_poller() -> ChangePoller:
+    return ChangePoller(get_settings().poller_state_path)
+
+
+def poll_for_changes() -> List[str]:
+    """바뀐 출처 이름 목록을 반환합니다. (빈 목록이면 재생성할 필요 없음)"""
+    return get_change_poller().poll()
@@ -0,0 +1,121 @@
+# circuit_breaker.py
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"         # 정상: 모든 요청 허용
+STATE_OPEN = "open"             # 차단: 요청을 보내지 않고 즉시 실패
+STATE_HALF_OPEN = "half_open"   # 시험: 한 번의 시험 요청만 허용
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 요청을 보내지 않았을 때 발생합니다."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"'{name}' 차단기 열림 ({retry_after:.0f}초 후 재시도)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    외부 출처 하나에 대한 차단기.
+
+    연속 실패가 failure_threshold회에 이르면 열리고, reset_seconds가 지나면 반열림 상태로
+    바뀌어 시험 요청 하나만 보냅니다. 시험 요청이 성공하면 닫히고, 실패하면 다시 열립니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_seconds: float = 120):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인합니다. 반열림 상태에서는 시험 요청 하나만 허용합니다."""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_OPEN:
+                if self.retry_after() > 0:
+                    return False
+                self.state = STATE_HALF_OPEN
+                logger.info(f"🟡 '{self.name}' 차단기 반열림 - 시험 요청을 보냅니다.")
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != STATE_CLOSED:
+                logger.info(f"🟢 '{self.name}' 차단기 닫힘 - 출처가 복구되었습니다.")
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """상태는 바꾸지 않고 시험 요청 자리만 반납합니다. (출처 장애로 볼 수 없는 오류)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self, error: Any = None) -> None:
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error) if error is not None else None
+            self._probe_in_flight = False
+            if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != STATE_OPEN:
+                    logger.warning(
+                        f"🔴 '{self.name}' 차단기 열림 - {self.failures}회 연속 실패, "
+                        f"{self.reset_seconds:.0f}초 동안 요청을 보내지 않습니다."
+                    )
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "retry_after_seconds": round(self.retry_after(), 1) if self.state == STATE_OPEN else 0,
+                "last_error": self.last_error,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """출처 이름별 차단기를 처음 사용할 때 생성합니다."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            settings = get_settings()
+            breaker = CircuitBreaker(name, settings.breaker_failure_threshold, settings.breaker_reset_seconds)
+            _breakers[name] = breaker
+        return breaker
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """지금까지 사용된 모든 차단기의 상태를 반환합니다."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
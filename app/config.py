@@ -1,32 +1,123 @@
 # config.py
 
 import os
-from datetime import datetime, timedelta
 import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
 
-# ✅ 로깅 설정
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-
-# OpenAPI 인증키
-UNION_API_KEY = os.environ.get("UNION_API_KEY")
-if UNION_API_KEY:
-    logger.info("🔐 UNION_API_KEY 로드 완료")
-else:
-    logger.warning("⚠️ UNION_API_KEY가 설정되지 않았습니다.")
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 
 # 통일부 OpenAPI 엔드포인트 예시
 NK_TREND_API_URL = "https://apis.data.go.kr/1250000/trend"
-logger.info(f"🌐 NK_TREND_API_URL: {NK_TREND_API_URL}")
 
 # 블로그 업로드 플랫폼 설정
 BLOG_PLATFORM = "tistory"
-logger.info(f"📝 BLOG_PLATFORM 설정: {BLOG_PLATFORM}")
 
 # 요약 문단 수 설정
 SUMMARY_PARAGRAPH_LIMIT = 6
-logger.info(f"📄 SUMMARY_PARAGRAPH_LIMIT: {SUMMARY_PARAGRAPH_LIMIT} 문단")
+
+
+def _env_flag(name: str) -> bool:
+    """'1', 'true', 'yes', 'on' 값을 참으로 해석합니다."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    환경 변수에서 읽어 온 애플리케이션 설정.
+    모듈 import 시점이 아니라 get_settings()가 처음 호출될 때 한 번만 읽습니다.
+    """
+    union_api_key: Optional[str]
+    openai_api_key: Optional[str]
+    tistory_cookie: Optional[str]
+    tistory_blog_name: Optional[str]
+    scheduler_mode: str
+    pregen_refresh_minutes: int
+    pregen_draft_path: str
+    pregen_lead_hours: float
+    pregen_draft_max_age_hours: float
+    snapshot_ttl_seconds: int
+    briefing_cache_size: int
+    briefing_cache_ttl_seconds: int
+    model_routes: Optional[str]
+    coordination_db_path: str
+    summarizer_output_mode: str
+    debug_endpoints_enabled: bool
+    pipeline_profile: bool
+    profile_output_dir: str
+    archive_enabled: bool
+    archive_dir: str
+    change_poller_enabled: bool
+    poll_interval_minutes: int
+    poller_state_path: str
+    publish_targets: Optional[str]
+    upstream_timeout_seconds: float
+    breaker_failure_threshold: int
+    breaker_reset_seconds: float
+    source_cache_path: str
+    max_stale_seconds: float
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            union_api_key=os.environ.get("UNION_API_KEY"),
+            openai_api_key=os.environ.get("OPENAI_API_KEY"),
+            tistory_cookie=os.environ.get("TISTORY_COOKIE"),
+            tistory_blog_name=os.environ.get("TISTORY_BLOG_NAME"),
+            scheduler_mode=os.environ.get("SCHEDULER_MODE", "direct"),
+            pregen_refresh_minutes=int(os.environ.get("PREGEN_REFRESH_MINUTES", "60")),
+            pregen_draft_path=os.environ.get("PREGEN_DRAFT_PATH", "data/drafts.json"),
+            # 게시 시각 몇 시간 전부터 초안을 만들지, 게시 시점에 초안을 몇 시간까지 신뢰할지
+            pregen_lead_hours=float(os.environ.get("PREGEN_LEAD_HOURS", "6")),
+            pregen_draft_max_age_hours=float(os.environ.get("PREGEN_DRAFT_MAX_AGE_HOURS", "12")),
+            snapshot_ttl_seconds=int(os.environ.get("SNAPSHOT_TTL_SECONDS", "300")),
+            briefing_cache_size=int(os.environ.get("BRIEFING_CACHE_SIZE", "64")),
+            # DALL·E 이미지 URL이 만료되기 전(약 1시간)에 캐시를 비웁니다.
+            briefing_cache_ttl_seconds=int(os.environ.get("BRIEFING_CACHE_TTL_SECONDS", "3000")),
+            model_routes=os.environ.get("MODEL_ROUTES"),
+            coordination_db_path=os.environ.get("COORDINATION_DB_PATH", "data/coordination.sqlite3"),
+            # json: title/html_body/image_prompt 스키마 응답, text: '제목: '/'본문: ' 구분자 응답
+            summarizer_output_mode=os.environ.get("SUMMARIZER_OUTPUT_MODE", "json"),
+            debug_endpoints_enabled=_env_flag("ENABLE_DEBUG_ENDPOINTS"),
+            pipeline_profile=_env_flag("PIPELINE_PROFILE"),
+            profile_output_dir=os.environ.get("PROFILE_OUTPUT_DIR", "data/profiles"),
+            archive_enabled=_env_flag("ARCHIVE_ENABLED"),
+            archive_dir=os.environ.get("ARCHIVE_DIR", "data/archive"),
+            change_poller_enabled=_env_flag("CHANGE_POLLER_ENABLED"),
+            poll_interval_minutes=int(os.environ.get("POLL_INTERVAL_MINUTES", "15")),
+            poller_state_path=os.environ.get("POLLER_STATE_PATH", "data/poller_state.json"),
+            # 게시 대상 목록(JSON 배열). 없으면 TISTORY_* 환경 변수의 블로그 하나에 게시합니다.
+            publish_targets=os.environ.get("PUBLISH_TARGETS"),
+            upstream_timeout_seconds=float(os.environ.get("UPSTREAM_TIMEOUT_SECONDS", "10")),
+            breaker_failure_threshold=int(os.environ.get("BREAKER_FAILURE_THRESHOLD", "3")),
+            breaker_reset_seconds=float(os.environ.get("BREAKER_RESET_SECONDS", "120")),
+            source_cache_path=os.environ.get("SOURCE_CACHE_PATH", "data/source_cache.json"),
+            # 수집 기간(최근 3일)보다 오래된 이전 데이터는 대체용으로도 쓰지 않습니다.
+            max_stale_seconds=float(os.environ.get("MAX_STALE_SECONDS", str(3 * 24 * 3600))),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 객체를 생성하여 반환합니다. (최초 1회만 환경 변수를 읽음)"""
+    settings = Settings.from_env()
+    if settings.union_api_key:
+        logger.info("🔐 UNION_API_KEY 로드 완료")
+    else:
+        logger.warning("⚠️ UNION_API_KEY가 설정되지 않았습니다.")
+    logger.info(f"📝 BLOG_PLATFORM 설정: {BLOG_PLATFORM}, 스케줄러 모드: {settings.scheduler_mode}")
+    return settings
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """루트 로거를 설정합니다. 애플리케이션 진입점에서 한 번만 호출합니다."""
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
 
 # 기본 날짜 계산 함수
 def get_default_date_range(days=3):
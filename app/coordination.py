@@ -0,0 +1,80 @@
+# coordination.py
+import logging
+import os
+import socket
+import sqlite3
+import time
+from datetime import datetime
+from functools import lru_cache
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 오래된 작업 선점 기록을 정리하는 기준 (초)
+CLAIM_RETENTION_SECONDS = 30 * 24 * 3600
+
+
+def current_slot(slot_minutes: int, now: float = None) -> str:
+    """
+    현재 시각이 속한 slot_minutes 단위 구간의 키를 반환합니다.
+    같은 구간에 실행된 여러 워커는 같은 키를 얻습니다.
+    """
+    now = time.time() if now is None else now
+    slot_start = int(now // (slot_minutes * 60)) * slot_minutes * 60
+    return datetime.fromtimestamp(slot_start).strftime("%Y-%m-%dT%H:%M")
+
+
+class JobClaims:
+    """
+    SQLite 파일에 (작업 ID, 구간) 단위 선점 기록을 남겨
+    여러 워커/레플리카 중 정확히 하나만 해당 구간의 작업을 실행하도록 합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_claims ("
+                " job_id TEXT NOT NULL,"
+                " slot TEXT NOT NULL,"
+                " owner TEXT NOT NULL,"
+                " claimed_at REAL NOT NULL,"
+                " PRIMARY KEY (job_id, slot))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # 워커마다 별도 프로세스이므로 호출 시마다 연결을 열고, 잠금 대기는 timeout으로 처리합니다.
+        return sqlite3.connect(self.path, timeout=30)
+
+    def try_claim(self, job_id: str, slot: str) -> bool:
+        """작업 구간을 선점합니다. 이미 다른 워커가 선점했다면 False를 반환합니다."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO job_claims (job_id, slot, owner, claimed_at) VALUES (?, ?, ?, ?)",
+                    (job_id, slot, self.owner, now),
+                )
+                claimed = cursor.rowcount == 1
+                if claimed:
+                    conn.execute("DELETE FROM job_claims WHERE claimed_at < ?", (now - CLAIM_RETENTION_SECONDS,))
+        finally:
+            conn.close()
+
+        if claimed:
+            logger.info(f"🔒 작업 선점 성공: {job_id} [{slot}] ({self.owner})")
+        else:
+            logger.info(f"⏭️ 다른 워커가 이미 실행한 작업입니다: {job_id} [{slot}]")
+        return claimed
+
+
+@lru_cache(maxsize=1)
+def get_job_claims() -> JobClaims:
+    """작업 선점 저장소를 처음 사용할 때 생성합니다."""
+    return JobClaims(get_settings().coordination_db_path)
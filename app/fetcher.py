@@ -1,25 +1,27 @@
 import requests
-import os
 from datetime import datetime, timedelta
+import json
 import logging
-from typing import Dict, Any, List, Optional, Callable
-from bs4 import BeautifulSoup
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from app.archive import KIND_API_RESPONSE, KIND_SCRAPE_HTML, archive_record
+from app.circuit_breaker import CircuitOpenError, get_breaker
+from app.config import get_settings
 
-# ✅ 로깅 설정
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-# ✅ API 키를 각 서비스에 맞게 별도로 설정
-# 환경 변수에 각 API 키를 설정해주세요. (예: UNION_TREND_API_KEY, UNION_OTHBC_API_KEY 등)
+# ✅ API 키는 요청 시점에 설정 객체(get_settings)에서 읽습니다.
+# 엔드포인트별로 다른 키가 필요하면 "key" 항목을 직접 지정할 수 있습니다.
 API_ENDPOINTS = {
     "북한 동향": {
-        "key": os.environ.get("UNION_API_KEY"),
         "url": "http://apis.data.go.kr/1250000/trend/getTrend",
         "parser": lambda item: {"title": item.get("sj", ""), "content": item.get("cn", "")},
         "params": {"cl": "ARGUMENT_DAIL"}
     },
     "김정은 공개 활동": {
-        "key": os.environ.get("UNION_API_KEY"),
         "url": "http://apis.data.go.kr/1250000/othbcact/getOthbcact",
         "parser": lambda item: {
             "title": item.get("nes_cn", "")[:100],  # 제목은 보도내용의 앞부분 100자로 설정
@@ -31,7 +33,6 @@ API_ENDPOINTS = {
         "params": {}
     },
     "통일부 보도자료": {
-        "key":os.environ.get("UNION_API_KEY"),
         "url": "http://apis.data.go.kr/1250000/nesdta/getNesdta",
         "parser": lambda item: {
             "title": item.get("sj", "").strip(), 
@@ -42,17 +43,31 @@ API_ENDPOINTS = {
 }
 
 
-def fetch_data_from_api(api_name: str, api_config: Dict[str, Any], start_date: str, end_date: str, max_items: int) -> Optional[str]:
+# 통일부 북한정보포털 동향 게시판
+UNIKOREA_TREND_BASE_URL = "https://nkinfo.unikorea.go.kr/nkp/trend/"
+UNIKOREA_TREND_LIST_URL = f"{UNIKOREA_TREND_BASE_URL}list.do"
+# 차단기와 마지막 정상 결과에 쓰는 출처 이름 (API는 API_ENDPOINTS의 이름을 사용)
+UNIKOREA_SOURCE_NAME = "북한정보포털"
+
+
+def get_collection_date_range(days: int = 3) -> Tuple[str, str]:
+    """오늘을 포함한 최근 N일간의 수집 기간(YYYYMMDD)을 반환합니다."""
+    today = datetime.today()
+    return (today - timedelta(days=days - 1)).strftime("%Y%m%d"), today.strftime("%Y%m%d")
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """수집기 전용 HTTP 세션을 처음 사용할 때 생성합니다. (커넥션 재사용)"""
+    return requests.Session()
+
+
+def build_api_params(api_config: Dict[str, Any], start_date: str, end_date: str, max_items: int) -> Optional[Dict[str, Any]]:
     """
-    단일 API에서 데이터를 가져오는 제네릭 함수입니다.
+    API 요청 파라미터를 만듭니다. 서비스 키가 없으면 None을 반환합니다.
     """
-    service_key = api_config["key"]
-    base_url = api_config["url"]
-    parser = api_config.get("parser")
-    extra_params = api_config.get("params", {})
-
+    service_key = api_config.get("key") or get_settings().union_api_key
     if not service_key:
-        logger.error(f"❌ '{api_name}' API 키가 설정되어 있지 않습니다.")
         return None
 
     # 모든 API에 공통적으로 적용되는 기본 파라미터
@@ -66,34 +81,201 @@ def fetch_data_from_api(api_name: str, api_config: Dict[str, Any], start_date: s
     }
     
     # API별 고유 파라미터 추가
-    params.update(extra_params)
-    
+    params.update(api_config.get("params", {}))
+    return params
+
+
+def guarded_get(source: str, url: str, **kwargs) -> requests.Response:
+    """
+    출처별 차단기를 거쳐 GET 요청을 보냅니다.
+    차단기가 열려 있으면 요청 없이 CircuitOpenError를, 실패하면 원래 예외를 발생시킵니다.
+    시간 초과, 연결 오류, 5xx 응답만 출처 장애로 기록합니다. 4xx(잘못된 키 등)는 설정 문제이므로
+    차단기를 열지 않습니다.
+    """
+    breaker = get_breaker(source)
+    if not breaker.allow_request():
+        raise CircuitOpenError(source, breaker.retry_after())
+    kwargs.setdefault("timeout", get_settings().upstream_timeout_seconds)
     try:
-        logger.info(f"🔗 '{api_name}' API 요청 중...")
-        # ✅ verify=True 또는 제거하여 SSL 검증 활성화
-        response = requests.get(base_url, params=params) 
-        response.raise_for_status()
-        logger.info(f"✅ '{api_name}' API 응답 수신 완료")
-        
-        data = response.json()
-        items = data.get("items", [])
-        
-        if not items:
-            logger.warning(f"⚠️ '{api_name}'에서 수신된 데이터가 없습니다.")
+        response = get_http_session().get(url, **kwargs)
+    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+        breaker.record_failure(e)
+        raise
+    except Exception:
+        breaker.release()
+        raise
+
+    if response.status_code >= 500:
+        error = requests.exceptions.HTTPError(f"{response.status_code} Server Error: {url}", response=response)
+        breaker.record_failure(error)
+        raise error
+    # 출처가 응답했으므로 4xx여도 차단기는 정상으로 기록하고, 오류는 호출자에게 전달합니다.
+    breaker.record_success()
+    response.raise_for_status()
+    return response
+
+
+# -----------------------------
+# 마지막 정상 수집 결과
+# -----------------------------
+class LastGoodStore:
+    """
+    출처별로 마지막으로 성공한 수집 결과를 보관합니다.
+    출처가 실패하거나 차단기가 열려 있으면 이 값을 수집 시각과 함께 대신 사용합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, str]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"❌ 마지막 수집 결과 로드 실패: {e}")
+            return {}
+
+    def put(self, source: str, text: str) -> None:
+        with self._lock:
+            self._entries[source] = {"text": text, "fetched_at": datetime.now().isoformat(timespec="seconds")}
+            if not self.path:
+                return
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.error(f"❌ 마지막 수집 결과 저장 실패: {e}")
+
+    def get(self, source: str) -> Optional[Tuple[str, datetime]]:
+        with self._lock:
+            entry = self._entries.get(source)
+        if not entry:
             return None
-        
-        logger.info(f"📦 '{api_name}' 수집된 항목 수: {len(items)}")
-
-        combined_text = ""
-        for item in items:
-            # ✅ 각 API의 반환 형식에 맞는 파서를 사용하여 데이터 추출
-            parsed_item = parser(item)
-            title = parsed_item.get("title", "")
-            content = parsed_item.get("content", "")
-            combined_text += f"[{title}]\n{content}\n\n"
-        
-        return combined_text
-    
+        return entry["text"], datetime.fromisoformat(entry["fetched_at"])
+
+    def ages(self) -> Dict[str, float]:
+        """출처별 마지막 정상 수집 이후 경과 시간(초)"""
+        with self._lock:
+            entries = dict(self._entries)
+        now = datetime.now()
+        return {
+            source: round((now - datetime.fromisoformat(entry["fetched_at"])).total_seconds())
+            for source, entry in entries.items()
+        }
+
+
+@lru_cache(maxsize=1)
+def get_last_good_store() -> LastGoodStore:
+    return LastGoodStore(get_settings().source_cache_path)
+
+
+def _format_age(seconds: float) -> str:
+    if seconds < 3600:
+        return f"{int(seconds // 60)}분"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}시간"
+    return f"{int(seconds // 86400)}일"
+
+
+def collect_source(source: str, loader: Callable[[], str]) -> str:
+    """
+    출처 하나를 수집합니다. 성공하면 결과를 보관하고, 실패하거나 차단기가 열려 있으면
+    MAX_STALE_SECONDS 이내의 마지막 정상 결과를 수집 시각 표시와 함께 반환합니다.
+    (사용할 결과가 없거나 4xx로 거부된 경우 빈 문자열)
+    """
+    try:
+        text = loader()
+    except CircuitOpenError as e:
+        logger.warning(f"⏭️ {e} - 마지막 정상 결과를 사용합니다.")
+    except requests.exceptions.HTTPError as e:
+        status = e.response.status_code if e.response is not None else None
+        if status is not None and status < 500:
+            # 4xx는 출처 장애가 아니라 설정 문제(API 키 등)이므로 이전 데이터로 가리지 않습니다.
+            logger.error(f"❌ '{source}' 요청 거부({status}) - 설정을 확인하세요. 이 출처는 제외합니다.")
+            return ""
+        logger.error(f"❌ '{source}' 수집 실패: {e}")
+    except Exception as e:
+        logger.error(f"❌ '{source}' 수집 실패: {e}")
+    else:
+        if text:
+            get_last_good_store().put(source, text)
+        return text
+
+    cached = get_last_good_store().get(source)
+    if not cached:
+        return ""
+    text, fetched_at = cached
+    age_seconds = (datetime.now() - fetched_at).total_seconds()
+    age = _format_age(age_seconds)
+    if age_seconds > get_settings().max_stale_seconds:
+        logger.warning(f"🗑️ '{source}' 마지막 정상 결과가 너무 오래되어({age} 전) 이 출처는 제외합니다.")
+        return ""
+    logger.warning(f"🗃️ '{source}' 캐시 사용: {fetched_at.isoformat(timespec='minutes')} 수집 ({age} 전)")
+    # 경과 시간 대신 수집 시각을 표시하여 같은 캐시가 쓰이는 동안 스냅샷 해시가 바뀌지 않게 합니다.
+    return f"※ 출처 응답 불가로 {fetched_at.strftime('%Y-%m-%d %H:%M')}에 수집한 이전 데이터입니다.\n\n{text}"
+
+
+def _fetch_api_text(api_name: str, api_config: Dict[str, Any], start_date: str, end_date: str, max_items: int) -> str:
+    """
+    단일 API에서 데이터를 가져옵니다. 요청 실패와 차단기 열림은 예외로 전달합니다.
+    """
+    base_url = api_config["url"]
+    parser = api_config.get("parser")
+
+    params = build_api_params(api_config, start_date, end_date, max_items)
+    if params is None:
+        logger.error(f"❌ '{api_name}' API 키가 설정되어 있지 않습니다.")
+        return ""
+
+    logger.info(f"🔗 '{api_name}' API 요청 중...")
+    # ✅ verify=True 또는 제거하여 SSL 검증 활성화
+    response = guarded_get(api_name, base_url, params=params)
+    logger.info(f"✅ '{api_name}' API 응답 수신 완료")
+    archive_record(
+        KIND_API_RESPONSE,
+        response.text,
+        key=api_name,
+        meta={"url": base_url, "start_date": start_date, "end_date": end_date}
+    )
+
+    data = response.json()
+    items = data.get("items", [])
+
+    if not items:
+        logger.warning(f"⚠️ '{api_name}'에서 수신된 데이터가 없습니다.")
+        return ""
+
+    logger.info(f"📦 '{api_name}' 수집된 항목 수: {len(items)}")
+
+    combined_text = ""
+    for item in items:
+        # ✅ 각 API의 반환 형식에 맞는 파서를 사용하여 데이터 추출
+        parsed_item = parser(item)
+        title = parsed_item.get("title", "")
+        content = parsed_item.get("content", "")
+        combined_text += f"[{title}]\n{content}\n\n"
+
+    return combined_text
+
+
+def fetch_data_from_api(api_name: str, api_config: Dict[str, Any], start_date: str, end_date: str, max_items: int) -> Optional[str]:
+    """
+    단일 API에서 데이터를 가져오는 제네릭 함수입니다.
+    """
+    try:
+        return _fetch_api_text(api_name, api_config, start_date, end_date, max_items) or None
+    except CircuitOpenError as e:
+        logger.warning(f"⏭️ {e}")
+        return None
     except requests.exceptions.RequestException as e:
         logger.error(f"❌ '{api_name}' API 요청 오류: {e}")
         return None
@@ -101,53 +283,72 @@ def fetch_data_from_api(api_name: str, api_config: Dict[str, Any], start_date: s
         logger.error(f"❌ '{api_name}' 처리 중 예외 발생: {e}")
         return None
 
+
+def _scrape_unikorea(target_dates: List[str]) -> Dict[str, List[Dict[str, str]]]:
+    """
+    북한정보포털 목록을 한 번만 받아 여러 날짜의 기사를 스크랩합니다.
+    요청 실패와 차단기 열림은 예외로 전달합니다.
+    """
+    # BeautifulSoup은 스크래핑 시에만 필요하므로 지연 import 합니다.
+    from bs4 import BeautifulSoup
+
+    base_url = UNIKOREA_TREND_BASE_URL
+    list_url = UNIKOREA_TREND_LIST_URL
+
+    scraped: Dict[str, List[Dict[str, str]]] = {target_date: [] for target_date in target_dates}
+
+    logger.info(f"🔗 통일부 북한정보포털에서 {', '.join(target_dates)} 기사 스크랩 시작...")
+    response = guarded_get(UNIKOREA_SOURCE_NAME, list_url)
+    archive_record(KIND_SCRAPE_HTML, response.text, key=list_url, meta={"target_dates": target_dates})
+
+    soup = BeautifulSoup(response.text, 'html.parser')
+
+    # <table>에서 등록일이 target_dates에 속하는 행을 찾습니다.
+    rows = soup.select('table tbody tr')
+
+    for row in rows:
+        date_td = row.select_one('td:nth-child(3)')
+        target_date = date_td.text.strip() if date_td else None
+        if target_date not in scraped:
+            continue
+        trend_mng_no_element = row.find('a', class_='trendViewBtn')
+        if trend_mng_no_element:
+            trend_mng_no = trend_mng_no_element.get('trendmngno')
+
+            if trend_mng_no:
+                article_url = f"{base_url}view.do?menuId=&trendMngNo={trend_mng_no}"
+
+                logger.info(f"🔗 기사 본문 스크랩 중: {article_url}")
+                article_response = guarded_get(UNIKOREA_SOURCE_NAME, article_url)
+                archive_record(KIND_SCRAPE_HTML, article_response.text, key=article_url)
+
+                article_soup = BeautifulSoup(article_response.text, 'html.parser')
+
+                title_element = article_soup.find('h4', id='trendTtl')
+                content_element = article_soup.find('div', id='index')
+
+                title = title_element.text.strip() if title_element else "제목 없음"
+                content = content_element.get_text(separator='\n', strip=True) if content_element else "내용 없음"
+
+                scraped[target_date].append({"title": title, "content": content})
+                logger.info(f"✅ 기사 스크랩 완료: '{title}'")
+
+    for target_date, articles in scraped.items():
+        if not articles:
+            logger.warning(f"⚠️ {target_date}에 해당하는 기사가 없습니다.")
+
+    return scraped
+
+
 def scrape_articles_from_unikorea(target_date: str) -> List[Dict[str, str]]:
     """
     통일부 북한정보포털에서 특정 날짜의 기사들을 스크랩합니다.
     """
-    base_url = "https://nkinfo.unikorea.go.kr/nkp/trend/"
-    list_url = f"{base_url}list.do"
-    
-    scraped_articles = []
-    
     try:
-        logger.info(f"🔗 통일부 북한정보포털에서 {target_date} 기사 스크랩 시작...")
-        response = requests.get(list_url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # <table>에서 등록일이 target_date인 행을 찾습니다.
-        rows = soup.select('table tbody tr')
-        
-        for row in rows:
-            date_td = row.select_one('td:nth-child(3)')
-            if date_td and date_td.text.strip() == target_date:
-                trend_mng_no_element = row.find('a', class_='trendViewBtn')
-                if trend_mng_no_element:
-                    trend_mng_no = trend_mng_no_element.get('trendmngno')
-                    
-                    if trend_mng_no:
-                        article_url = f"{base_url}view.do?menuId=&trendMngNo={trend_mng_no}"
-                        
-                        logger.info(f"🔗 기사 본문 스크랩 중: {article_url}")
-                        article_response = requests.get(article_url)
-                        article_response.raise_for_status()
-                        
-                        article_soup = BeautifulSoup(article_response.text, 'html.parser')
-                        
-                        title_element = article_soup.find('h4', id='trendTtl')
-                        content_element = article_soup.find('div', id='index')
-                        
-                        title = title_element.text.strip() if title_element else "제목 없음"
-                        content = content_element.get_text(separator='\n', strip=True) if content_element else "내용 없음"
-                        
-                        scraped_articles.append({"title": title, "content": content})
-                        logger.info(f"✅ 기사 스크랩 완료: '{title}'")
-        
-        if not scraped_articles:
-            logger.warning(f"⚠️ {target_date}에 해당하는 기사가 없습니다.")
-            
+        return _scrape_unikorea([target_date])[target_date]
+    except CircuitOpenError as e:
+        logger.warning(f"⏭️ {e}")
+        return []
     except requests.exceptions.RequestException as e:
         logger.error(f"❌ 웹 스크래핑 오류: {e}")
         return []
@@ -155,17 +356,26 @@ def scrape_articles_from_unikorea(target_date: str) -> List[Dict[str, str]]:
         logger.error(f"❌ 스크래핑 중 예외 발생: {e}")
         return []
 
-    return scraped_articles
+
+def _scrape_unikorea_text(target_dates: List[str]) -> str:
+    scraped_text = ""
+    for target_date_str, scraped_articles in _scrape_unikorea(target_dates).items():
+        if scraped_articles:
+            scraped_text += f"\n\n--- '{target_date_str}' 스크랩 데이터 시작 ---\n\n"
+            for article in scraped_articles:
+                scraped_text += f"[{article['title']}]\n{article['content']}\n\n"
+            scraped_text += f"\n--- '{target_date_str}' 스크랩 데이터 끝 ---\n"
+    return scraped_text
+
 
 def fetch_all_north_korea_trends(start_date=None, end_date=None, max_items=10) -> str:
     """
     정의된 3개의 API와 웹 스크래핑을 통해 최근 3일간의 데이터를 모두 가져와 합칩니다.
+    응답하지 않는 출처는 차단기로 건너뛰고 마지막 정상 결과로 대체합니다.
     """
     today = datetime.today()
     # 최근 3일간의 데이터를 가져오도록 시작일을 오늘 - 2일로 설정
-    start_date_dt = today - timedelta(days=2)
-    start_date = start_date_dt.strftime("%Y%m%d")
-    end_date = today.strftime("%Y%m%d")
+    start_date, end_date = get_collection_date_range(3)
 
     logger.info(f"📡 API 및 스크래핑 동향 수집 시작: {start_date} ~ {end_date}")
     
@@ -173,34 +383,22 @@ def fetch_all_north_korea_trends(start_date=None, end_date=None, max_items=10) -
     
     # 1. API 데이터 수집
     for api_name, api_config in API_ENDPOINTS.items():
-        api_text = fetch_data_from_api(api_name, api_config, start_date, end_date, max_items)
+        api_text = collect_source(
+            api_name,
+            lambda: _fetch_api_text(api_name, api_config, start_date, end_date, max_items)
+        )
         if api_text:
             all_combined_text += f"\n\n--- '{api_name}' 데이터 시작 ---\n\n"
             all_combined_text += api_text
             all_combined_text += f"\n--- '{api_name}' 데이터 끝 ---\n"
 
-    # 2. 스크래핑 데이터 수집
-    scraped_data_found = False
-    scraped_text = ""
-    for i in range(3):
-        target_date_dt = today - timedelta(days=i)
-        target_date_str = target_date_dt.strftime("%Y.%m.%d.")
-        
-        scraped_articles = scrape_articles_from_unikorea(target_date_str)
-        
-        if scraped_articles:
-            scraped_data_found = True
-            scraped_text += f"\n\n--- '{target_date_str}' 스크랩 데이터 시작 ---\n\n"
-            for article in scraped_articles:
-                scraped_text += f"[{article['title']}]\n{article['content']}\n\n"
-            scraped_text += f"\n--- '{target_date_str}' 스크랩 데이터 끝 ---\n"
-    
-    if scraped_data_found:
-        all_combined_text += scraped_text
+    # 2. 스크래핑 데이터 수집 (목록 페이지는 한 번만 요청)
+    target_dates = [(today - timedelta(days=i)).strftime("%Y.%m.%d.") for i in range(3)]
+    all_combined_text += collect_source(UNIKOREA_SOURCE_NAME, lambda: _scrape_unikorea_text(target_dates))
         
     if not all_combined_text.strip():
         logger.warning("⚠️ API 및 스크래핑 모두에서 데이터를 가져오지 못했습니다.")
         return "해당 기간에 대한 북한 동향 데이터가 없습니다."
         
     logger.info("📝 모든 API 및 스크래핑 데이터 병합 완료")
-    return all_combined_text.strip()
\ No newline at end of file
+    return all_combined_text.strip()
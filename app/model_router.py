@@ -0,0 +1,209 @@
+# model_router.py
+import json
+import logging
+import statistics
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict, fields, replace
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# 생성 목적(purpose)
+# -----------------------------
+PURPOSE_PREVIEW = "preview"            # 웹 UI 미리보기
+PURPOSE_PUBLISH = "publish"            # 블로그 게시 (수동/스케줄/사전 생성 초안)
+PURPOSE_BACKFILL = "backfill"          # 과거 데이터 일괄 생성 (python -m app.archive resummarize)
+
+# 최근 지연 시간을 몇 건까지 보관할지
+LATENCY_WINDOW = 100
+
+
+@dataclass(frozen=True)
+class Route:
+    """목적/스타일별 모델 및 생성 파라미터"""
+    model: str
+    max_tokens: int
+    temperature: float = 0.7
+    image_model: Optional[str] = None   # None이면 이미지를 생성하지 않습니다.
+    image_size: str = "1024x1024"
+    fallback_model: Optional[str] = None
+    latency_slo_seconds: Optional[float] = None
+
+
+DEFAULT_ROUTES: Dict[str, Route] = {
+    PURPOSE_PREVIEW: Route(model="gpt-4o-mini", max_tokens=1500, image_model="dall-e-2", image_size="512x512"),
+    PURPOSE_PUBLISH: Route(
+        model="gpt-4o",
+        max_tokens=2000,
+        image_model="dall-e-3",
+        image_size="1024x1024",
+        fallback_model="gpt-4o-mini",
+        latency_slo_seconds=90,
+    ),
+    PURPOSE_BACKFILL: Route(model="gpt-4o-mini", max_tokens=1500),
+}
+
+
+class RouteStats:
+    """라우트(목적, 스타일, 모델)별 호출 수, 지연 시간, 토큰 사용량을 기록합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    def record(
+        self,
+        purpose: str,
+        style: str,
+        model: str,
+        latency: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        error: bool = False,
+    ) -> None:
+        key = (purpose, style, model)
+        with self._lock:
+            entry = self._stats.setdefault(key, {
+                "calls": 0,
+                "errors": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "latencies": deque(maxlen=LATENCY_WINDOW),
+            })
+            entry["calls"] += 1
+            entry["errors"] += int(error)
+            entry["prompt_tokens"] += prompt_tokens
+            entry["completion_tokens"] += completion_tokens
+            entry["latencies"].append(latency)
+
+    def snapshot(self) -> list:
+        """JSON으로 직렬화 가능한 통계 목록을 반환합니다."""
+        with self._lock:
+            items = [(key, dict(entry, latencies=list(entry["latencies"]))) for key, entry in self._stats.items()]
+
+        result = []
+        for (purpose, style, model), entry in items:
+            latencies: list = sorted(entry.pop("latencies"))
+            p95_index = max(0, int(round(len(latencies) * 0.95)) - 1)
+            result.append({
+                "purpose": purpose,
+                "style": style,
+                "model": model,
+                **entry,
+                "latency_p50_seconds": round(statistics.median(latencies), 3) if latencies else None,
+                "latency_p95_seconds": round(latencies[p95_index], 3) if latencies else None,
+            })
+        return result
+
+
+ROUTE_FIELDS = frozenset(f.name for f in fields(Route))
+
+
+def _route_field_types() -> Dict[str, Tuple[type, bool]]:
+    """Route 필드별 (값 타입, None 허용 여부)를 반환합니다."""
+    types = {}
+    for name, annotation in get_type_hints(Route).items():
+        args = get_args(annotation)
+        if get_origin(annotation) is Union and type(None) in args:
+            types[name] = (next(arg for arg in args if arg is not type(None)), True)
+        else:
+            types[name] = (annotation, False)
+    return types
+
+
+ROUTE_FIELD_TYPES = _route_field_types()
+
+
+def _coerce_route_value(name: str, value: Any) -> Any:
+    """
+    MODEL_ROUTES 값을 Route 필드 타입으로 변환합니다. ("2000" → 2000)
+    변환할 수 없으면 ValueError를 발생시킵니다.
+    """
+    expected, nullable = ROUTE_FIELD_TYPES[name]
+    if value is None:
+        if nullable:
+            return None
+        raise ValueError(f"'{name}'에는 null을 사용할 수 없습니다.")
+    if expected is str:
+        if isinstance(value, str) and value:
+            return value
+    elif not isinstance(value, bool):
+        try:
+            number = expected(value)
+            if expected is int and isinstance(value, float) and number != value:
+                raise ValueError
+            return number
+        except (TypeError, ValueError):
+            pass
+    raise ValueError(f"'{name}' 값 {value!r}은(는) {expected.__name__} 타입이어야 합니다.")
+
+
+def _validate_overrides(raw: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    MODEL_ROUTES 항목을 검사하고 값을 Route 필드 타입으로 변환합니다. 객체가 아니거나
+    Route에 없는 키, 변환할 수 없는 값이 있는 항목은 오류를 로그로 남기고 제외합니다.
+    (잘못된 항목 하나가 모든 호출을 실패시키지 않도록)
+    """
+    if not isinstance(raw, dict):
+        logger.error("❌ MODEL_ROUTES는 JSON 객체여야 합니다. 기본 라우팅을 사용합니다.")
+        return {}
+    overrides: Dict[str, Dict[str, Any]] = {}
+    for key, override in raw.items():
+        if not isinstance(override, dict):
+            logger.error(f"❌ MODEL_ROUTES['{key}']는 JSON 객체여야 합니다. 이 항목을 무시합니다.")
+            continue
+        unknown = set(override) - ROUTE_FIELDS
+        if unknown:
+            logger.error(f"❌ MODEL_ROUTES['{key}']에 알 수 없는 키가 있습니다: {', '.join(sorted(unknown))}. 이 항목을 무시합니다.")
+            continue
+        try:
+            overrides[key] = {name: _coerce_route_value(name, value) for name, value in override.items()}
+        except ValueError as e:
+            logger.error(f"❌ MODEL_ROUTES['{key}'] 값 오류: {e} 이 항목을 무시합니다.")
+    return overrides
+
+
+class ModelRouter:
+    """
+    목적과 스타일에 맞는 Route를 결정합니다.
+    MODEL_ROUTES 환경 변수(JSON)로 "publish" 또는 "publish:hi"처럼
+    목적 전체나 특정 스타일의 값을 덮어쓸 수 있습니다.
+    """
+
+    def __init__(self, overrides: Optional[Dict[str, Dict[str, Any]]] = None):
+        self._overrides = overrides or {}
+        self.stats = RouteStats()
+
+    @classmethod
+    def from_settings(cls) -> "ModelRouter":
+        raw = get_settings().model_routes
+        overrides: Dict[str, Dict[str, Any]] = {}
+        if raw:
+            try:
+                overrides = _validate_overrides(json.loads(raw))
+                logger.info(f"🧭 모델 라우팅 설정 로드: {', '.join(overrides)}")
+            except json.JSONDecodeError as e:
+                logger.error(f"❌ MODEL_ROUTES 파싱 실패, 기본 라우팅을 사용합니다: {e}")
+        return cls(overrides)
+
+    def resolve(self, purpose: str, style: Optional[str] = None) -> Route:
+        route = DEFAULT_ROUTES.get(purpose, DEFAULT_ROUTES[PURPOSE_PREVIEW])
+        for key in (purpose, f"{purpose}:{style}"):
+            if key in self._overrides:
+                route = replace(route, **self._overrides[key])
+        return route
+
+    def describe(self) -> Dict[str, Any]:
+        """현재 적용 중인 목적별 라우트를 반환합니다."""
+        return {purpose: asdict(self.resolve(purpose)) for purpose in DEFAULT_ROUTES}
+
+
+@lru_cache(maxsize=1)
+def get_model_router() -> ModelRouter:
+    """모델 라우터를 처음 사용할 때 생성합니다."""
+    return ModelRouter.from_settings()
@@ -0,0 +1,192 @@
+# pregenerator.py
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from app.snapshot import SourceSnapshot, take_snapshot
+from app.model_router import PURPOSE_PUBLISH
+from app.styles import get_style_registry, next_publish_time
+from app.summarizer import summarize_and_generate_image, generate_news_image
+
+logger = logging.getLogger(__name__)
+
+# DALL·E가 반환하는 이미지 URL은 약 1시간 뒤 만료되므로 여유를 두고 재생성합니다.
+IMAGE_URL_TTL = timedelta(minutes=55)
+
+
+@dataclass
+class Draft:
+    """게시 전에 미리 생성해 둔 기사 초안"""
+    language_code: str
+    title: str
+    summary_html: str
+    image_url: Optional[str]
+    content_hash: str
+    generated_at: str
+    image_generated_at: Optional[str] = None
+
+    def age(self, now: Optional[datetime] = None) -> timedelta:
+        """초안이 생성된 뒤 지난 시간"""
+        return (now or datetime.now()) - datetime.fromisoformat(self.generated_at)
+
+    def image_is_stale(self, now: Optional[datetime] = None, margin: timedelta = timedelta(0)) -> bool:
+        """
+        이미지 URL이 만료되었을 가능성이 있는지 확인합니다.
+        margin을 지정하면 지금부터 margin 동안 계속 유효한지를 기준으로 판단합니다.
+        """
+        if not self.image_url or not self.image_generated_at:
+            return False
+        now = now or datetime.now()
+        return now + margin - datetime.fromisoformat(self.image_generated_at) > IMAGE_URL_TTL
+
+
+class DraftStore:
+    """
+    언어 코드별 초안을 메모리에 보관하고 JSON 파일로 저장합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._drafts: Dict[str, Draft] = {}
+        self._lock = threading.Lock()
+        self._loaded_mtime: Optional[float] = None
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            mtime = os.path.getmtime(self.path)
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            self._drafts = {code: Draft(**data) for code, data in raw.items()}
+            self._loaded_mtime = mtime
+            logger.info(f"📂 저장된 초안 {len(self._drafts)}건 로드 완료: {self.path}")
+        except Exception as e:
+            logger.error(f"❌ 초안 파일 로드 실패: {e}")
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({code: asdict(d) for code, d in self._drafts.items()}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._loaded_mtime = os.path.getmtime(self.path)
+
+    def _reload_if_changed(self) -> None:
+        """다른 워커가 파일을 갱신했으면 다시 읽습니다."""
+        if self.path and os.path.exists(self.path) and os.path.getmtime(self.path) != self._loaded_mtime:
+            self._load()
+
+    def get(self, language_code: str) -> Optional[Draft]:
+        with self._lock:
+            self._reload_if_changed()
+            return self._drafts.get(language_code)
+
+    def put(self, draft: Draft) -> None:
+        with self._lock:
+            self._reload_if_changed()
+            self._drafts[draft.language_code] = draft
+            self._save()
+
+
+def build_draft(snapshot: SourceSnapshot, language_code: str) -> Optional[Draft]:
+    """
+    스냅샷으로부터 한 언어의 초안(제목, 본문)을 생성합니다.
+    이미지 URL은 게시 시점 전에 만료되므로 이미지는 게시할 때 ensure_fresh_image로 만듭니다.
+    """
+    title, summary_html, _ = summarize_and_generate_image(
+        snapshot.text, language=language_code, purpose=PURPOSE_PUBLISH, with_image=False
+    )
+    if not title or not summary_html or title == "[오류]":
+        logger.error(f"❌ '{language_code}' 초안 생성 실패")
+        return None
+    return Draft(
+        language_code=language_code,
+        title=title,
+        summary_html=summary_html,
+        image_url=None,
+        content_hash=snapshot.content_hash,
+        generated_at=datetime.now().isoformat(),
+    )
+
+
+def upcoming_slots(language_codes: Iterable[str], lead: timedelta, now: Optional[datetime] = None) -> Dict[str, datetime]:
+    """다음 게시 시각이 지금부터 lead 이내인 언어와 그 게시 시각을 반환합니다."""
+    registry = get_style_registry()
+    now = now or datetime.now()
+    slots = {}
+    for language_code in language_codes:
+        slot = next_publish_time(registry.schedule[language_code], now)
+        if slot - now <= lead:
+            slots[language_code] = slot
+    return slots
+
+
+def _needs_refresh(draft: Optional[Draft], slot: datetime, lead: timedelta, content_hash: Optional[str] = None) -> bool:
+    """이번 게시 시각의 생성 구간(slot - lead 이후)에 만든 초안이 없거나 원문 해시가 다르면 참입니다."""
+    if draft is None or datetime.fromisoformat(draft.generated_at) < slot - lead:
+        return True
+    return content_hash is not None and draft.content_hash != content_hash
+
+
+def pending_languages(store: DraftStore, language_codes: Iterable[str], lead: timedelta, now: Optional[datetime] = None) -> List[str]:
+    """게시 시각이 lead 이내로 다가왔는데 이번 구간의 초안이 아직 없는 언어 목록을 반환합니다."""
+    return [
+        language_code
+        for language_code, slot in upcoming_slots(language_codes, lead, now).items()
+        if _needs_refresh(store.get(language_code), slot, lead)
+    ]
+
+
+def refresh_drafts(
+    store: DraftStore,
+    language_codes: Iterable[str],
+    lead: timedelta,
+    snapshot: Optional[SourceSnapshot] = None,
+    now: Optional[datetime] = None
+) -> int:
+    """
+    게시 시각이 lead 이내로 다가온 언어의 초안만 최신 스냅샷으로 갱신합니다.
+    이번 구간에 같은 원문으로 만든 초안이 있으면 유지하며, 갱신된 초안 수를 반환합니다.
+    """
+    slots = upcoming_slots(language_codes, lead, now)
+    if not slots:
+        logger.info("⏭️ 생성 구간에 들어온 게시 시각이 없어 초안 갱신을 건너뜁니다.")
+        return 0
+
+    snapshot = snapshot or take_snapshot()
+    if snapshot.is_empty:
+        logger.warning("⚠️ 스냅샷이 비어 있어 초안 갱신을 건너뜁니다.")
+        return 0
+
+    refreshed = 0
+    for language_code, slot in slots.items():
+        if not _needs_refresh(store.get(language_code), slot, lead, snapshot.content_hash):
+            logger.info(f"⏭️ '{language_code}' 초안 유지 (원문 변경 없음)")
+            continue
+        draft = build_draft(snapshot, language_code)
+        if draft:
+            store.put(draft)
+            refreshed += 1
+            logger.info(f"📝 '{language_code}' 초안 갱신 완료: {draft.title}")
+    return refreshed
+
+
+def ensure_fresh_image(store: DraftStore, draft: Draft) -> Draft:
+    """초안에 이미지가 없거나 URL이 만료되었을 가능성이 있으면 이미지만 생성합니다."""
+    if draft.image_url and not draft.image_is_stale():
+        return draft
+    logger.info(f"🖼 '{draft.language_code}' 초안 이미지 생성 (게시 직전)")
+    draft.image_url = generate_news_image(draft.title, purpose=PURPOSE_PUBLISH, language=draft.language_code)
+    draft.image_generated_at = datetime.now().isoformat() if draft.image_url else None
+    store.put(draft)
+    return draft
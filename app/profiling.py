@@ -0,0 +1,165 @@
+# profiling.py
+import cProfile
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 샘플링 프로파일러의 기본 샘플 간격 (초)
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# 다운로드 가능한 결과 파일 이름
+ARTIFACT_FILES = {
+    "summary": "summary.json",
+    "cprofile": "profile.prof",          # pstats / snakeviz
+    "flamegraph": "stacks.collapsed",    # flamegraph.pl / speedscope (collapsed stack 형식)
+}
+
+# tracemalloc은 프로세스 전역이므로 한 번에 하나의 프로파일만 실행합니다.
+_profile_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """다른 프로파일링이 이미 실행 중일 때 발생합니다."""
+
+
+@dataclass
+class StageProfile:
+    """파이프라인 단계별 측정 결과"""
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: int
+
+
+class StackSampler(threading.Thread):
+    """
+    대상 스레드의 호출 스택을 주기적으로 샘플링하여 collapsed stack 형식으로 집계합니다.
+    각 스택의 맨 앞에는 당시 실행 중이던 파이프라인 단계 이름이 붙습니다.
+    """
+
+    def __init__(self, target_thread_id: int, profiler: "PipelineProfiler", interval: float):
+        super().__init__(name="pipeline-stack-sampler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.profiler = profiler
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is None:
+                continue
+            names: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            names.append(f"stage:{self.profiler.current_stage or 'idle'}")
+            self.stacks[";".join(reversed(names))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class PipelineProfiler:
+    """
+    파이프라인 한 번의 실행을 cProfile, 샘플링 프로파일러, tracemalloc으로 측정하고
+    결과를 output_dir/<run_id>/ 아래에 저장합니다.
+    """
+
+    def __init__(self, output_dir: str, label: str, sample_interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.run_dir = os.path.join(output_dir, self.run_id)
+        self.label = label
+        self.sample_interval = sample_interval
+        self.stages: List[StageProfile] = []
+        self.current_stage: Optional[str] = None
+        self._cprofile = cProfile.Profile()
+        self._sampler: Optional[StackSampler] = None
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> "PipelineProfiler":
+        if not _profile_lock.acquire(blocking=False):
+            raise ProfilerBusyError("이미 다른 프로파일링이 실행 중입니다.")
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._sampler = StackSampler(threading.get_ident(), self, self.sample_interval)
+        self._sampler.start()
+        self._cprofile.enable()
+        logger.info(f"🔬 프로파일링 시작: {self.run_id} ({self.label})")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._cprofile.disable()
+            self._sampler.stop()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+            self._save(error=str(exc) if exc else None)
+            logger.info(f"🔬 프로파일링 결과 저장 완료: {self.run_dir}")
+        finally:
+            _profile_lock.release()
+
+    @contextmanager
+    def stage(self, name: str):
+        """단계별 벽시계 시간, CPU 시간, 최대 메모리 사용량을 측정합니다."""
+        self.current_stage = name
+        tracemalloc.reset_peak()
+        base_memory, _ = tracemalloc.get_traced_memory()
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield
+        finally:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            self.stages.append(StageProfile(
+                name=name,
+                wall_seconds=round(time.perf_counter() - wall_started, 4),
+                cpu_seconds=round(time.thread_time() - cpu_started, 4),
+                peak_memory_bytes=max(0, peak_memory - base_memory),
+            ))
+            self.current_stage = None
+            logger.info(f"🔬 단계 '{name}' 완료: {self.stages[-1].wall_seconds}초")
+
+    def summary(self, error: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "label": self.label,
+            "error": error,
+            "stages": [asdict(stage) for stage in self.stages],
+            "samples": sum(self._sampler.stacks.values()) if self._sampler else 0,
+            "artifacts": list(ARTIFACT_FILES),
+        }
+
+    def _save(self, error: Optional[str] = None) -> None:
+        os.makedirs(self.run_dir, exist_ok=True)
+        self._cprofile.dump_stats(os.path.join(self.run_dir, ARTIFACT_FILES["cprofile"]))
+        with open(os.path.join(self.run_dir, ARTIFACT_FILES["flamegraph"]), "w", encoding="utf-8") as f:
+            for stack, count in self._sampler.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(os.path.join(self.run_dir, ARTIFACT_FILES["summary"]), "w", encoding="utf-8") as f:
+            json.dump(self.summary(error), f, ensure_ascii=False, indent=2)
+
+
+def artifact_path(output_dir: str, run_id: str, artifact: str) -> Optional[str]:
+    """저장된 프로파일 결과 파일 경로를 반환합니다. (없거나 잘못된 이름이면 None)"""
+    filename = ARTIFACT_FILES.get(artifact)
+    if not filename or run_id in ("", ".", "..") or os.path.basename(run_id) != run_id:
+        return None
+    path = os.path.join(output_dir, run_id, filename)
+    return path if os.path.exists(path) else None
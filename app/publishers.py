@@ -0,0 +1,265 @@
+# publishers.py
+import hashlib
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from app.blog_uploader import upload_to_tistory
+from app.config import get_settings
+from app.styles import get_style_registry
+
+logger = logging.getLogger(__name__)
+
+# 동시에 게시할 수 있는 최대 대상 수
+MAX_PUBLISH_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class Article:
+    """게시할 완성된 기사. 모든 대상에 같은 내용을 그대로 보냅니다."""
+    title: str
+    html: str
+    language_code: str
+    image_url: Optional[str] = None
+
+
+@dataclass
+class PublishResult:
+    """대상별 게시 결과"""
+    target: str
+    ok: bool
+    url: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class Publisher(ABC):
+    """
+    게시 대상의 기본 클래스. publish()는 게시된 위치(URL 또는 경로)를 반환하고,
+    실패하면 예외를 발생시킵니다. HTTP 세션은 대상마다 하나씩 만들어 재사용합니다.
+    """
+    kind = ""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
+    @abstractmethod
+    def publish(self, article: Article) -> str:
+        ...
+
+
+class TistoryPublisher(Publisher):
+    """
+    Tistory 블로그 (쿠키 기반 업로드)
+    카테고리 ID는 블로그마다 다르므로 blog_name을 지정한 대상은 categories(언어 코드 → 카테고리 ID)가
+    필요합니다. blog_name/cookie가 없는 기본 블로그만 스타일 레지스트리의 카테고리를 사용합니다.
+    """
+    kind = "tistory"
+
+    def __init__(
+        self,
+        name: str,
+        blog_name: Optional[str] = None,
+        cookie: Optional[str] = None,
+        categories: Optional[Dict[str, int]] = None,
+        visibility: int = 20
+    ):
+        super().__init__(name)
+        is_default_blog = blog_name is None and cookie is None
+        if categories is None and not is_default_blog:
+            raise ValueError(f"'{name}'에는 categories(언어 코드 → 카테고리 ID)가 필요합니다.")
+        self.blog_name = blog_name
+        self.cookie = cookie
+        self.categories = categories
+        self.visibility = visibility
+
+    def publish(self, article: Article) -> str:
+        post_url = upload_to_tistory(
+            article.title,
+            article.html,
+            article.language_code,
+            self.categories if self.categories is not None else get_style_registry().category_map,
+            visibility=self.visibility,
+            blog_name=self.blog_name,
+            cookie=self.cookie,
+            session=self.session,
+        )
+        if not post_url:
+            raise RuntimeError("post_url이 반환되지 않음")
+        return post_url
+
+
+class MarkdownPublisher(Publisher):
+    """정적 사이트 생성기(Jekyll/Hugo 등)용 Markdown 파일을 디스크에 씁니다."""
+    kind = "markdown"
+
+    def __init__(self, name: str, directory: str):
+        super().__init__(name)
+        self.directory = directory
+
+    def publish(self, article: Article) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        now = datetime.now()
+        digest = hashlib.sha256(article.title.encode("utf-8")).hexdigest()[:8]
+        path = os.path.join(self.directory, f"{now.strftime('%Y-%m-%d')}-{article.language_code}-{digest}.md")
+
+        front_matter = {
+            "title": article.title,
+            "date": now.isoformat(timespec="seconds"),
+            "lang": article.language_code,
+            "image": article.image_url or "",
+        }
+        # JSON 문자열은 YAML에서도 유효하므로 따옴표/특수문자 이스케이프에 그대로 사용합니다.
+        lines = ["---"] + [f"{key}: {json.dumps(value, ensure_ascii=False)}" for key, value in front_matter.items()] + ["---", ""]
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+            f.write(article.html)
+            f.write("\n")
+        os.replace(tmp_path, path)
+        return path
+
+
+class WebhookPublisher(Publisher):
+    """기사를 JSON으로 임의의 웹훅 URL에 POST 합니다."""
+    kind = "webhook"
+
+    def __init__(self, name: str, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30):
+        super().__init__(name)
+        self.url = url
+        self.headers = headers or {}
+        self.timeout = timeout
+
+    def publish(self, article: Article) -> str:
+        response = self.session.post(
+            self.url,
+            headers=self.headers,
+            json={
+                "title": article.title,
+                "content": article.html,
+                "language": article.language_code,
+                "image_url": article.image_url,
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        # 웹훅이 게시 위치를 돌려주면 그 값을, 아니면 웹훅 URL을 결과로 남깁니다.
+        # 게시는 이미 성공했으므로 응답 본문의 형식(JSON 배열 등)과 관계없이 실패로 보지 않습니다.
+        try:
+            location = response.json().get("url")
+        except Exception:
+            return self.url
+        return location if isinstance(location, str) and location else self.url
+
+
+PUBLISHER_TYPES = {
+    TistoryPublisher.kind: TistoryPublisher,
+    MarkdownPublisher.kind: MarkdownPublisher,
+    WebhookPublisher.kind: WebhookPublisher,
+}
+
+
+def build_publisher(config: Dict[str, Any]) -> Publisher:
+    """
+    PUBLISH_TARGETS 항목 하나로 게시 대상을 만듭니다.
+    비밀 값은 "cookie_env"처럼 *_env 키로 환경 변수 이름을 지정해 읽을 수 있습니다.
+    """
+    options = dict(config)
+    kind = options.pop("type", TistoryPublisher.kind)
+    publisher_cls = PUBLISHER_TYPES.get(kind)
+    if publisher_cls is None:
+        raise ValueError(f"알 수 없는 게시 대상 유형: {kind}")
+    for key in [k for k in options if k.endswith("_env")]:
+        options[key[:-len("_env")]] = os.environ.get(options.pop(key))
+    name = options.pop("name", None) or f"{kind}:{options.get('blog_name') or options.get('directory') or options.get('url') or 'default'}"
+    return publisher_cls(name, **options)
+
+
+@lru_cache(maxsize=1)
+def get_publishers() -> List[Publisher]:
+    """
+    PUBLISH_TARGETS(JSON 배열)로 게시 대상을 만듭니다.
+    설정이 없으면 TISTORY_BLOG_NAME/TISTORY_COOKIE의 Tistory 블로그 하나를 사용합니다.
+    """
+    raw = get_settings().publish_targets
+    default_configs: List[Dict[str, Any]] = [{"type": TistoryPublisher.kind}]
+    configs = default_configs
+    if raw:
+        try:
+            configs = json.loads(raw)
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ PUBLISH_TARGETS 파싱 실패, 기본 Tistory 대상을 사용합니다: {e}")
+        if not isinstance(configs, list):
+            logger.error("❌ PUBLISH_TARGETS는 JSON 배열이어야 합니다. 기본 Tistory 대상을 사용합니다.")
+            configs = default_configs
+
+    publishers = []
+    for config in configs:
+        if not isinstance(config, dict):
+            logger.error(f"❌ 게시 대상 설정 오류: 항목은 JSON 객체여야 합니다: {config!r}")
+            continue
+        try:
+            publishers.append(build_publisher(config))
+        except (TypeError, ValueError) as e:
+            # 항목에 쿠키 등 비밀 값이 있을 수 있으므로 유형과 이름만 남깁니다.
+            logger.error(f"❌ 게시 대상 설정 오류 ({config.get('type')}, {config.get('name')}): {e}")
+    logger.info(f"📡 게시 대상 {len(publishers)}곳: {', '.join(p.name for p in publishers)}")
+    return publishers
+
+
+@lru_cache(maxsize=1)
+def _get_publish_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=MAX_PUBLISH_WORKERS, thread_name_prefix="publisher")
+
+
+def _publish_one(publisher: Publisher, article: Article) -> PublishResult:
+    started = time.perf_counter()
+    try:
+        location = publisher.publish(article)
+        result = PublishResult(publisher.name, True, url=location)
+        logger.info(f"✅ '{publisher.name}' 게시 성공: {location}")
+    except Exception as e:
+        result = PublishResult(publisher.name, False, error=str(e))
+        logger.error(f"❌ '{publisher.name}' 게시 실패: {e}")
+    result.elapsed_seconds = round(time.perf_counter() - started, 3)
+    return result
+
+
+def publish_to_all(title: str, html: str, language_code: str, image_url: Optional[str] = None) -> List[PublishResult]:
+    """
+    생성된 기사 하나를 설정된 모든 대상에 동시에 게시하고 대상별 결과를 반환합니다.
+    한 대상의 실패나 지연은 다른 대상의 게시에 영향을 주지 않습니다.
+    """
+    article = Article(title=title, html=html, language_code=language_code, image_url=image_url)
+    publishers = get_publishers()
+    if not publishers:
+        logger.error("❌ 설정된 게시 대상이 없습니다.")
+        return []
+    executor = _get_publish_executor()
+    futures = [executor.submit(_publish_one, publisher, article) for publisher in publishers]
+    return [future.result() for future in futures]
+
+
+def first_published_url(results: List[PublishResult]) -> Optional[str]:
+    """성공한 첫 번째 대상의 게시 위치를 반환합니다."""
+    return next((result.url for result in results if result.ok), None)
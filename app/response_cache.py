@@ -0,0 +1,112 @@
+# response_cache.py
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 응답 본문과 조건부 요청용 검증자(ETag, Last-Modified)"""
+    payload: Dict[str, Any]
+    etag: str = ""
+    last_modified: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self):
+        if not self.etag:
+            body = json.dumps(self.payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+            self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match 헤더 값이 현재 ETag와 일치하는지 확인합니다."""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(tag.removeprefix("W/") == self.etag for tag in candidates)
+
+
+class ResponseCache:
+    """
+    키별 응답을 메모리에 보관하는 LRU 캐시.
+    같은 키에 대한 동시 요청은 하나의 생성 작업(single flight)을 공유합니다.
+    ttl_seconds가 지난 항목은 만료된 것으로 보고 다시 생성합니다.
+    """
+
+    def __init__(self, maxsize: int = 64, ttl_seconds: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._inflight: Dict[Hashable, "asyncio.Future[CachedResponse]"] = {}
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.ttl_seconds is not None and time.monotonic() - entry.created_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Dict[str, Any]]],
+        cacheable: Callable[[Dict[str, Any]], bool] = lambda payload: True,
+    ) -> CachedResponse:
+        """
+        캐시에 있으면 바로 반환하고, 없으면 factory로 생성합니다.
+        이미 같은 키를 생성 중인 요청이 있으면 그 결과를 기다립니다.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            logger.info(f"⚡ 캐시 적중: {key}")
+            return entry
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info(f"⏳ 동일 요청 생성 대기: {key}")
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[CachedResponse]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            payload = await factory()
+            entry = CachedResponse(payload=payload)
+            if cacheable(payload):
+                self.put(key, entry)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception was never retrieved" 경고를 막습니다.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,114 @@
+# snapshot.py
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from app.archive import (
+    KIND_CORPUS,
+    archive_contains,
+    archive_record,
+    archive_run,
+    compute_content_hash,
+    deferred_records,
+    flush_records,
+)
+from app.fetcher import fetch_all_north_korea_trends
+
+logger = logging.getLogger(__name__)
+
+# fetch_all_north_korea_trends가 데이터를 찾지 못했을 때 반환하는 문구
+EMPTY_SNAPSHOT_TEXT = "해당 기간에 대한 북한 동향 데이터가 없습니다."
+
+
+@dataclass
+class SourceSnapshot:
+    """한 시점에 수집된 원문 데이터와 그 해시"""
+    text: str
+    content_hash: str
+    fetched_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.text or self.text == EMPTY_SNAPSHOT_TEXT
+
+
+def take_snapshot() -> SourceSnapshot:
+    """
+    모든 API와 스크래핑 데이터를 수집하여 스냅샷을 생성합니다.
+    원본 응답과 병합된 원문은 같은 실행 ID로 아카이브에 남습니다.
+    같은 해시의 원문이 이미 보관되어 있으면 원본 응답과 원문을 다시 기록하지 않습니다.
+    """
+    with archive_run():
+        with deferred_records() as raw_records:
+            text = fetch_all_north_korea_trends()
+        snapshot = SourceSnapshot(text=text or "", content_hash=compute_content_hash(text or ""))
+        if archive_contains(KIND_CORPUS, snapshot.content_hash):
+            logger.info(f"🗄️ 같은 원문이 이미 보관되어 있어 아카이브 기록을 건너뜁니다. ({len(raw_records)}건)")
+        else:
+            flush_records(raw_records)
+            archive_record(KIND_CORPUS, snapshot.text, key=snapshot.content_hash)
+    logger.info(f"📸 스냅샷 생성 완료: 해시 {snapshot.content_hash[:12]}, 길이 {len(snapshot.text)}자")
+    return snapshot
+
+
+# -----------------------------
+# 최신 스냅샷 캐시
+# -----------------------------
+_latest_snapshot: Optional[SourceSnapshot] = None
+_snapshot_generation = 0
+_snapshot_lock = threading.Lock()
+# 진행 중인 수집 작업 (이벤트 루프 스레드에서만 읽고 씁니다)
+_inflight_snapshot: "Optional[asyncio.Future[SourceSnapshot]]" = None
+
+
+def _refresh_latest_snapshot(generation: int) -> SourceSnapshot:
+    """스냅샷을 수집하고, 그사이 무효화되지 않았다면 최신 스냅샷으로 저장합니다."""
+    global _latest_snapshot
+    snapshot = take_snapshot()
+    with _snapshot_lock:
+        if generation == _snapshot_generation:
+            _latest_snapshot = snapshot
+    return snapshot
+
+
+def _clear_inflight(future: "asyncio.Future[SourceSnapshot]") -> None:
+    global _inflight_snapshot
+    if _inflight_snapshot is future:
+        _inflight_snapshot = None
+    if not future.cancelled():
+        # 대기자가 없을 때 "exception was never retrieved" 경고를 막습니다.
+        future.exception()
+
+
+async def get_latest_snapshot(max_age_seconds: float) -> SourceSnapshot:
+    """
+    max_age_seconds 이내에 수집된 스냅샷이 있으면 재사용하고, 없으면 새로 수집합니다.
+    동시에 여러 요청이 들어와도 수집은 한 번만 수행되며, 나머지 요청은 스레드를 점유하지 않고
+    이벤트 루프에서 그 결과를 기다립니다. (수집에는 스레드 하나만 사용)
+    """
+    global _inflight_snapshot
+    snapshot = _latest_snapshot
+    if snapshot and (datetime.now() - snapshot.fetched_at).total_seconds() < max_age_seconds:
+        return snapshot
+
+    if _inflight_snapshot is None:
+        future = asyncio.get_running_loop().run_in_executor(None, _refresh_latest_snapshot, _snapshot_generation)
+        future.add_done_callback(_clear_inflight)
+        _inflight_snapshot = future
+    else:
+        logger.info("⏳ 진행 중인 스냅샷 수집 대기")
+    # 요청 하나가 취소되어도 다른 요청이 기다리는 수집 작업은 계속됩니다.
+    return await asyncio.shield(_inflight_snapshot)
+
+
+def invalidate_latest_snapshot() -> None:
+    """출처 변경이 감지되었을 때 캐시된 스냅샷을 버려 다음 요청에서 새로 수집하게 합니다."""
+    global _latest_snapshot, _snapshot_generation, _inflight_snapshot
+    with _snapshot_lock:
+        _latest_snapshot = None
+        # 변경 전에 시작된 수집 결과는 최신 스냅샷으로 저장하지 않습니다.
+        _snapshot_generation += 1
+    _inflight_snapshot = None
@@ -0,0 +1,125 @@
+# structured_output.py
+import json
+import logging
+import re
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기사 응답에 포함되어야 하는 필드
+ARTICLE_FIELDS = ("title", "html_body", "image_prompt")
+
+# OpenAI response_format(json_schema)에 전달할 스키마
+ARTICLE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "news_article",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "기사 제목 (한 문장)"},
+                "html_body": {"type": "string", "description": "HTML로 작성된 기사 본문"},
+                "image_prompt": {"type": "string", "description": "기사 대표 이미지를 위한 영어 이미지 생성 프롬프트"},
+            },
+            "required": list(ARTICLE_FIELDS),
+            "additionalProperties": False,
+        },
+    },
+}
+
+# JSON 모드에서 시스템 프롬프트 뒤에 덧붙이는 출력 형식 지시
+ARTICLE_FORMAT_INSTRUCTION = (
+    "\n\n응답은 반드시 title, html_body, image_prompt 필드를 가진 JSON 객체로만 작성하세요. "
+    "'제목: '/'본문: ' 구분 지시는 각각 title, html_body 필드로 대체합니다. "
+    "image_prompt에는 기사 내용을 표현하는 사실적인 뉴스 사진을 영어로 묘사하세요."
+)
+
+# 완결된 문자열 필드: "field": "value"
+_COMPLETE_FIELD = r'"{field}"\s*:\s*"((?:[^"\\]|\\.)*)"'
+# 응답이 잘려 닫히지 않은 문자열 필드: "field": "value...
+_PARTIAL_FIELD = r'"{field}"\s*:\s*"((?:[^"\\]|\\.)*)\\?$'
+
+
+def _decode_json_string(raw: str) -> str:
+    try:
+        return json.loads(f'"{raw}"')
+    except json.JSONDecodeError:
+        return raw.replace('\\"', '"').replace("\\n", "\n")
+
+
+def parse_article_reply(reply: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    모델 응답에서 기사 필드를 추출합니다.
+    JSON 전체 파싱에 실패하면(잘린 응답 등) 완결된 필드만 하나씩 추출하고,
+    마지막에 잘린 필드는 부분 값으로 따로 반환합니다.
+
+    :return: (완결된 필드, 잘린 필드의 부분 값)
+    """
+    try:
+        data = json.loads(reply)
+        if isinstance(data, dict):
+            fields = {k: v.strip() for k, v in data.items() if k in ARTICLE_FIELDS and isinstance(v, str) and v.strip()}
+            return fields, {}
+    except json.JSONDecodeError:
+        pass
+
+    fields: Dict[str, str] = {}
+    partial: Dict[str, str] = {}
+    for field in ARTICLE_FIELDS:
+        match = re.search(_COMPLETE_FIELD.format(field=field), reply, re.DOTALL)
+        if match:
+            value = _decode_json_string(match.group(1)).strip()
+            if value:
+                fields[field] = value
+            continue
+        match = re.search(_PARTIAL_FIELD.format(field=field), reply.rstrip(), re.DOTALL)
+        if match:
+            value = _decode_json_string(match.group(1)).strip()
+            if value:
+                partial[field] = value
+
+    logger.warning(f"⚠️ JSON 응답 파싱 실패 - 추출된 필드: {list(fields)}, 잘린 필드: {list(partial)}")
+    return fields, partial
+
+
+def missing_fields(fields: Dict[str, str]) -> Tuple[str, ...]:
+    return tuple(field for field in ARTICLE_FIELDS if not fields.get(field))
+
+
+def build_body_request_prompt(user_prompt: str, fields: Dict[str, str]) -> str:
+    """
+    본문이 전혀 없을 때(필드 누락, 본문 시작 전에 잘린 응답) 본문만 다시 요청하는 프롬프트를 만듭니다.
+    이어 쓸 본문이 없으므로 이 경우에만 원문 데이터가 포함된 원래 요청을 다시 보냅니다.
+    """
+    title_line = f"\n제목: {fields['title']}" if fields.get("title") else ""
+    return (
+        f"{user_prompt}\n\n"
+        f"위 요구사항에 맞는 기사 본문만 HTML로 작성하세요. 제목, JSON, 다른 설명은 쓰지 마세요.{title_line}"
+    )
+
+
+def build_followup_prompt(field: str, fields: Dict[str, str], partial_value: Optional[str] = None) -> Optional[str]:
+    """
+    누락된 필드 하나만 다시 요청하는 짧은 후속 프롬프트를 만듭니다.
+    원문 데이터 전체 대신 이미 받은 필드만 문맥으로 사용합니다.
+    만들 수 없으면(본문 문맥이 전혀 없는 경우) None을 반환합니다.
+    """
+    body_excerpt = (fields.get("html_body") or partial_value or "")[:2000]
+    if field == "title" and body_excerpt:
+        return (
+            "다음 기사 본문에 어울리는 한 문장 제목만 작성하세요. 제목 외의 내용은 쓰지 마세요.\n\n"
+            f"본문:\n{body_excerpt}"
+        )
+    if field == "image_prompt" and (fields.get("title") or body_excerpt):
+        return (
+            "다음 뉴스 기사의 대표 이미지를 위한 사실적인 뉴스 사진 묘사를 영어 한두 문장으로만 작성하세요.\n\n"
+            f"제목: {fields.get('title', '')}\n본문 일부:\n{body_excerpt[:800]}"
+        )
+    if field == "html_body" and partial_value:
+        return (
+            "다음은 중간에 끊긴 HTML 기사 본문입니다. 끊긴 지점부터 이어서 자연스럽게 마무리하는 HTML만 작성하세요. "
+            "앞부분을 반복하지 마세요.\n\n"
+            f"제목: {fields.get('title', '')}\n끊긴 본문:\n{partial_value[-3000:]}"
+        )
+    return None
@@ -0,0 +1,288 @@
+# styles.py
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 스타일 코드 (알 수 없는 코드가 들어오면 이 스타일을 사용)
+DEFAULT_STYLE_CODE = "ko"
+
+# 모든 스타일은 매주 일요일에 게시됩니다. (APScheduler cron 표기)
+PUBLISH_DAY_OF_WEEK = "sun"
+
+# APScheduler cron 요일 표기 (datetime.weekday() 순서)
+CRON_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# -----------------------------
+# 스타일(언어 코드)별 프롬프트, 카테고리, 게시 시간 정의
+# 스케줄러, API 엔드포인트, 웹 UI(/styles)가 모두 이 정의를 사용합니다.
+# -----------------------------
+STYLE_DEFINITIONS: Dict[str, Dict[str, Any]] = {
+    "ko": {
+        "name": "긍정적 관점",
+        "category_id": 1193166,
+        "publish_hour": 21,
+        "system_prompt": "당신은 긍정적 관점의 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '북한 경제, 예상보다 성장세! 통계로 본 희망 신호'와 같은 제목을 생성해주세요.\n"
+            "2. 북한의 최근 생산량 증가나 특정 산업의 발전을 중심으로 서술하고, 북한 경제의 긍정적인 측면을 부각하여 희망적인 톤으로 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "en": {
+        "name": "부정적 관점",
+        "category_id": 1193919,
+        "publish_hour": 23,
+        "system_prompt": "당신은 부정적 관점의 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '북한 경제 성장률, 숨겨진 그림자는? 통계 이면의 현실'과 같은 제목을 생성해주세요.\n"
+            "2. 식량난, 무역 적자, 경제난 등의 데이터를 중심으로 서술하고, 북한 경제의 부정적인 측면을 강조하여 비판적인 톤으로 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "zh": {
+        "name": "미래 예측",
+        "category_id": 1193920,
+        "publish_hour": 1,
+        "system_prompt": "당신은 미래 예측 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '데이터로 예측하는 5년 뒤 북한 경제의 모습'과 같은 제목을 생성해주세요.\n"
+            "2. 가능한 시나리오를 제시하고, 현재 데이터를 바탕으로 북한 경제의 향후 5년 변화를 예측하는 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "ja": {
+        "name": "대외 관계",
+        "category_id": 1193921,
+        "publish_hour": 3,
+        "system_prompt": "당신은 대외 관계 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '북한 경제 성장이 남북 관계에 미치는 영향은?'과 같은 제목을 생성해주세요.\n"
+            "2. 경제 데이터를 정치적 맥락과 연결하여 설명하고, 북한 경제 성장이 남북 관계나 국제 정세에 미치는 영향을 분석하는 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "ru": {
+        "name": "카드 뉴스 형식",
+        "category_id": 1193922,
+        "publish_hour": 5,
+        "system_prompt": "당신은 카드 뉴스 형식 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '30초 만에 끝내는 북한 경제 핵심 브리핑'과 같은 제목을 생성해주세요.\n"
+            "2. 각 문장이 짧고 명확하게 구성되도록 하고, 핵심 데이터만 뽑아서 간결하게 정리하는 카드 뉴스 형식의 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "de": {
+        "name": "심층 분석",
+        "category_id": 1193923,
+        "publish_hour": 7,
+        "system_prompt": "당신은 심층 분석 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '북한의 식량 생산량, 통계의 진실은?'과 같은 제목을 생성해주세요.\n"
+            "2. 세부적인 수치와 배경을 상세히 설명하고, 특정 데이터(예: 농업 생산량, 에너지 수급) 하나를 선택하여 심층적으로 분석하는 전문가 스타일의 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "fr": {
+        "name": "Q&A 형식",
+        "category_id": 1193924,
+        "publish_hour": 9,
+        "system_prompt": "당신은 Q&A 형식 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '북한 경제에 대한 궁금증 5가지, 데이터를 통해 답하다'와 같은 제목을 생성해주세요.\n"
+            "2. 독자들이 궁금해할 만한 북한 경제 관련 질문 3~4개를 선정하고, 데이터에 근거하여 답변하는 Q&A 형식의 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "es": {
+        "name": "인포그래픽 설명",
+        "category_id": 1193925,
+        "publish_hour": 11,
+        "system_prompt": "당신은 인포그래픽 설명 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '인포그래픽으로 보는 북한 경제 현황'과 같은 제목을 생성해주세요.\n"
+            "2. 데이터의 주요 포인트들을 명확한 문장으로 요약하고, 복잡한 통계 데이터를 시각적으로 설명하는 인포그래픽을 위한 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "ar": {
+        "name": "초보자용",
+        "category_id": 1193926,
+        "publish_hour": 13,
+        "system_prompt": "당신은 초보자용 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '북한 경제, 10분 만에 이해하기'와 같은 제목을 생성해주세요.\n"
+            "2. 북한 경제에 대해 전혀 모르는 초보자를 대상으로, 어려운 용어 없이 쉽고 재미있게 풀어 설명하는 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "hi": {
+        "name": "전문가용",
+        "category_id": 1193929,
+        "publish_hour": 15,
+        "system_prompt": "당신은 전문가용 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '북한 경제 데이터 분석 보고서'와 같은 제목을 생성해주세요.\n"
+            "2. 세부적인 통계 수치를 인용하고, 정책적 함의를 논하는 내용을 포함하여, 북한 전문가나 연구자를 위한 심도 깊은 분석 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "vi": {
+        "name": "흥미 위주",
+        "category_id": 1193927,
+        "publish_hour": 17,
+        "system_prompt": "당신은 흥미 위주 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 '북한에서 가장 잘 나가는 핫템은?'과 같이 독특한 제목을 생성해주세요.\n"
+            "2. 흥미롭고 자극적인 제목과 내용을 포함하여 독자의 호기심을 유발하는 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    },
+    "id": {
+        "name": "결론 및 종합",
+        "category_id": 1193928,
+        "publish_hour": 19,
+        "system_prompt": "당신은 결론 및 종합 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
+        "user_prompt_suffix": (
+            "다음 요구사항에 맞춰 작성해주세요:\n"
+            "1. 내용을 한 문장으로 요약하는 하루 동안의 시리즈를 마무리하는 느낌으로, '오늘의 북한 경제: 데이터가 우리에게 말하는 것은?'과 같은 제목을 생성해주세요.\n"
+            "2. 오늘 다룬 북한 경제 데이터의 모든 내용을 종합하고, 그 의미와 시사점을 분석하는 최종 결론 본문을 작성해주세요.\n"
+            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
+            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
+        ),
+        "title_prefix": "제목: ",
+        "body_prefix": "본문: ",
+    }
+}
+
+
+@dataclass(frozen=True)
+class Style:
+    """미리 조합된 프롬프트를 포함한 기사 스타일"""
+    code: str
+    name: str
+    category_id: int
+    publish_hour: int
+    system_prompt: str
+    user_prompt_prefix: str
+    title_prefix: str
+    body_prefix: str
+
+    def build_user_prompt(self, text: str) -> str:
+        """미리 조합해 둔 요구사항 뒤에 원문 데이터를 붙여 사용자 프롬프트를 만듭니다."""
+        return self.user_prompt_prefix + text
+
+    def to_public_dict(self) -> Dict[str, Any]:
+        """UI에 노출할 메타데이터만 반환합니다. (프롬프트 제외)"""
+        return {
+            "code": self.code,
+            "name": self.name,
+            "category_id": self.category_id,
+            "publish_day_of_week": PUBLISH_DAY_OF_WEEK,
+            "publish_hour": self.publish_hour,
+        }
+
+
+class StyleRegistry:
+    """
+    스타일 정의를 한 번만 읽어 프롬프트, 카테고리 맵, 게시 스케줄을 미리 계산해 둡니다.
+    """
+
+    def __init__(self, definitions: Dict[str, Dict[str, Any]]):
+        self._styles: Dict[str, Style] = {
+            code: Style(
+                code=code,
+                name=spec["name"],
+                category_id=int(spec["category_id"]),
+                publish_hour=int(spec["publish_hour"]),
+                system_prompt=spec["system_prompt"],
+                user_prompt_prefix=f"{spec['user_prompt_suffix']}데이터:\n",
+                title_prefix=spec["title_prefix"],
+                body_prefix=spec["body_prefix"],
+            )
+            for code, spec in definitions.items()
+        }
+        self.codes: List[str] = list(self._styles)
+        self.names: List[str] = [style.name for style in self._styles.values()]
+        self.category_map: Dict[str, int] = {code: style.category_id for code, style in self._styles.items()}
+        self.schedule: Dict[str, int] = {code: style.publish_hour for code, style in self._styles.items()}
+        self.public_styles: List[Dict[str, Any]] = [style.to_public_dict() for style in self._styles.values()]
+        logger.info(f"🎨 스타일 {len(self._styles)}개 로드 완료")
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._styles
+
+    def get(self, code: Optional[str]) -> Optional[Style]:
+        return self._styles.get(code)
+
+    def resolve(self, code: Optional[str]) -> Style:
+        """코드에 해당하는 스타일을 반환하고, 없으면 기본 스타일을 반환합니다."""
+        return self._styles.get(code) or self._styles[DEFAULT_STYLE_CODE]
+
+    def display_name(self, code: Optional[str], default: str = "기본") -> str:
+        style = self._styles.get(code)
+        return style.name if style else default
+
+
+def next_publish_time(publish_hour: int, now: Optional[datetime] = None) -> datetime:
+    """now 이후 가장 가까운 게시 시각(PUBLISH_DAY_OF_WEEK의 publish_hour시 0분)을 반환합니다."""
+    now = now or datetime.now()
+    days_ahead = (CRON_WEEKDAYS.index(PUBLISH_DAY_OF_WEEK) - now.weekday()) % 7
+    slot = now.replace(hour=publish_hour, minute=0, second=0, microsecond=0) + timedelta(days=days_ahead)
+    if slot <= now:
+        slot += timedelta(days=7)
+    return slot
+
+
+@lru_cache(maxsize=1)
+def get_style_registry() -> StyleRegistry:
+    """스타일 레지스트리를 생성하여 반환합니다. (최초 1회만 생성)"""
+    return StyleRegistry(STYLE_DEFINITIONS)
@@ -1,185 +1,117 @@
 # summarizer.py
-import os
 import datetime
 import logging
-from typing import Optional, Tuple
-from openai import OpenAI
+import time
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-# -----------------------------
-# 로거 설정
-# -----------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s"
+from app.archive import KIND_ARTICLE, KIND_COMPLETION, KIND_PROMPT, archive_record, archive_run, compute_content_hash
+from app.config import get_settings
+from app.model_router import PURPOSE_PREVIEW, PURPOSE_PUBLISH, Route, get_model_router
+from app.structured_output import (
+    ARTICLE_FORMAT_INSTRUCTION,
+    ARTICLE_RESPONSE_FORMAT,
+    build_body_request_prompt,
+    build_followup_prompt,
+    missing_fields,
+    parse_article_reply,
 )
+from app.styles import get_style_registry
+
 logger = logging.getLogger(__name__)
 
 # -----------------------------
 # OpenAI API 클라이언트 설정
 # -----------------------------
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+@lru_cache(maxsize=1)
+def get_openai_client():
+    """
+    OpenAI 클라이언트를 처음 사용할 때 생성합니다.
+    openai 패키지 import 비용이 커서 모듈 import 시점에는 불러오지 않습니다.
+    """
+    from openai import OpenAI
+    return OpenAI(api_key=get_settings().openai_api_key)
+
 
 # -----------------------------
-# 언어별 프롬프트 및 메타데이터 설정
+# 라우팅된 모델로 글 생성
 # -----------------------------
-LANGUAGES = {
-    "ko": {
-        "name": "긍정적 관점",
-        "system_prompt": "당신은 긍정적 관점의 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '북한 경제, 예상보다 성장세! 통계로 본 희망 신호'와 같은 제목을 생성해주세요.\n"
-            "2. 북한의 최근 생산량 증가나 특정 산업의 발전을 중심으로 서술하고, 북한 경제의 긍정적인 측면을 부각하여 희망적인 톤으로 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "en": {
-        "name": "부정적 관점",
-        "system_prompt": "당신은 부정적 관점의 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '북한 경제 성장률, 숨겨진 그림자는? 통계 이면의 현실'과 같은 제목을 생성해주세요.\n"
-            "2. 식량난, 무역 적자, 경제난 등의 데이터를 중심으로 서술하고, 북한 경제의 부정적인 측면을 강조하여 비판적인 톤으로 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "zh": {
-        "name": "미래 예측",
-        "system_prompt": "당신은 미래 예측 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '데이터로 예측하는 5년 뒤 북한 경제의 모습'과 같은 제목을 생성해주세요.\n"
-            "2. 가능한 시나리오를 제시하고, 현재 데이터를 바탕으로 북한 경제의 향후 5년 변화를 예측하는 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "ja": {
-        "name": "대외 관계",
-        "system_prompt": "당신은 대외 관계 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '북한 경제 성장이 남북 관계에 미치는 영향은?'과 같은 제목을 생성해주세요.\n"
-            "2. 경제 데이터를 정치적 맥락과 연결하여 설명하고, 북한 경제 성장이 남북 관계나 국제 정세에 미치는 영향을 분석하는 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "ru": {
-        "name": "카드 뉴스 형식",
-        "system_prompt": "당신은 카드 뉴스 형식 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '30초 만에 끝내는 북한 경제 핵심 브리핑'과 같은 제목을 생성해주세요.\n"
-            "2. 각 문장이 짧고 명확하게 구성되도록 하고, 핵심 데이터만 뽑아서 간결하게 정리하는 카드 뉴스 형식의 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "de": {
-        "name": "심층 분석",
-        "system_prompt": "당신은 심층 분석 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '북한의 식량 생산량, 통계의 진실은?'과 같은 제목을 생성해주세요.\n"
-            "2. 세부적인 수치와 배경을 상세히 설명하고, 특정 데이터(예: 농업 생산량, 에너지 수급) 하나를 선택하여 심층적으로 분석하는 전문가 스타일의 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "fr": {
-        "name": "Q&A 형식",
-        "system_prompt": "당신은 Q&A 형식 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '북한 경제에 대한 궁금증 5가지, 데이터를 통해 답하다'와 같은 제목을 생성해주세요.\n"
-            "2. 독자들이 궁금해할 만한 북한 경제 관련 질문 3~4개를 선정하고, 데이터에 근거하여 답변하는 Q&A 형식의 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "es": {
-        "name": "인포그래픽 설명",
-        "system_prompt": "당신은 인포그래픽 설명 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '인포그래픽으로 보는 북한 경제 현황'과 같은 제목을 생성해주세요.\n"
-            "2. 데이터의 주요 포인트들을 명확한 문장으로 요약하고, 복잡한 통계 데이터를 시각적으로 설명하는 인포그래픽을 위한 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "ar": {
-        "name": "초보자용",
-        "system_prompt": "당신은 초보자용 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '북한 경제, 10분 만에 이해하기'와 같은 제목을 생성해주세요.\n"
-            "2. 북한 경제에 대해 전혀 모르는 초보자를 대상으로, 어려운 용어 없이 쉽고 재미있게 풀어 설명하는 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "hi": {
-        "name": "전문가용",
-        "system_prompt": "당신은 전문가용 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '북한 경제 데이터 분석 보고서'와 같은 제목을 생성해주세요.\n"
-            "2. 세부적인 통계 수치를 인용하고, 정책적 함의를 논하는 내용을 포함하여, 북한 전문가나 연구자를 위한 심도 깊은 분석 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "vi": {
-        "name": "흥미 위주",
-        "system_prompt": "당신은 흥미 위주 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 '북한에서 가장 잘 나가는 핫템은?'과 같이 독특한 제목을 생성해주세요.\n"
-            "2. 흥미롭고 자극적인 제목과 내용을 포함하여 독자의 호기심을 유발하는 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    },
-    "id": {
-        "name": "결론 및 종합",
-        "system_prompt": "당신은 결론 및 종합 한국어 뉴스 기자입니다. 북한 관련 뉴스를 정확하고 객관적으로 작성하세요.",
-        "user_prompt_suffix": (
-            "다음 요구사항에 맞춰 작성해주세요:\n"
-            "1. 내용을 한 문장으로 요약하는 하루 동안의 시리즈를 마무리하는 느낌으로, '오늘의 북한 경제: 데이터가 우리에게 말하는 것은?'과 같은 제목을 생성해주세요.\n"
-            "2. 오늘 다룬 북한 경제 데이터의 모든 내용을 종합하고, 그 의미와 시사점을 분석하는 최종 결론 본문을 작성해주세요.\n"
-            "3. 제목과 본문을 `제목: [제목]`과 `본문: [본문]` 형식으로 구분해주세요.\n"
-            "4. 본문은 HTML을 사용해 깔끔하게 작성해주세요.\n\n"
-        ),
-        "title_prefix": "제목: ",
-        "body_prefix": "본문: ",
-    }
-}
+def _strip_corpus(messages: List[Dict[str, str]], corpus: Optional[str]) -> List[Dict[str, str]]:
+    """메시지 안의 원문을 {{corpus:<해시>}} 자리 표시자로 바꿉니다."""
+    if not corpus:
+        return messages
+    placeholder = f"{{{{corpus:{compute_content_hash(corpus)}}}}}"
+    return [{**message, "content": message["content"].replace(corpus, placeholder)} for message in messages]
+
+
+def _create_chat_completion(
+    route: Route,
+    purpose: str,
+    style_code: str,
+    messages: List[Dict[str, str]],
+    response_format: Optional[Dict[str, Any]] = None,
+    corpus: Optional[str] = None
+) -> str:
+    """
+    라우트에 지정된 모델로 글을 생성하고 지연 시간과 토큰 사용량을 기록합니다.
+    지연 시간 SLO를 넘기면(타임아웃) fallback 모델로 한 번 더 시도합니다.
+    corpus를 지정하면 아카이브에는 원문 대신 원문 해시 자리 표시자를 남깁니다.
+    (원문은 이미 corpus 레코드로 보관됨)
+    """
+    from openai import APITimeoutError
+
+    stats = get_model_router().stats
+    client = get_openai_client()
+    models = [route.model] + ([route.fallback_model] if route.fallback_model else [])
+
+    archive_key = f"{purpose}:{style_code}"
+    for attempt, model in enumerate(models):
+        # 마지막 시도에는 SLO 타임아웃을 적용하지 않습니다.
+        is_last = attempt == len(models) - 1
+        timeout = route.latency_slo_seconds if route.latency_slo_seconds and not is_last else None
+        # SLO가 걸린 시도는 클라이언트 자체 재시도(기본 2회)를 끄고 바로 fallback으로 넘어갑니다.
+        attempt_client = client.with_options(timeout=timeout, max_retries=0) if timeout else client
+        started = time.perf_counter()
+        try:
+            response = attempt_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=route.temperature,
+                max_tokens=route.max_tokens,
+                **({"response_format": response_format} if response_format else {})
+            )
+        except APITimeoutError:
+            stats.record(purpose, style_code, model, time.perf_counter() - started, error=True)
+            if is_last:
+                raise
+            logger.warning(f"⏱️ '{model}' 응답이 SLO({timeout}초)를 초과했습니다. '{models[attempt + 1]}'로 재시도합니다.")
+            continue
+        except Exception:
+            stats.record(purpose, style_code, model, time.perf_counter() - started, error=True)
+            raise
+
+        archive_record(
+            KIND_PROMPT,
+            {"model": model, "messages": _strip_corpus(messages, corpus), "response_format": response_format},
+            key=archive_key,
+            meta={"corpus_hash": compute_content_hash(corpus)} if corpus else None
+        )
+        content = response.choices[0].message.content.strip()
+        archive_record(KIND_COMPLETION, content, key=archive_key, meta={"model": model})
+
+        usage = response.usage
+        stats.record(
+            purpose,
+            style_code,
+            model,
+            time.perf_counter() - started,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+        )
+        return content
+
+    raise RuntimeError("모든 모델 호출이 실패했습니다.")
 
 
 # -----------------------------
@@ -187,57 +119,76 @@ LANGUAGES = {
 # -----------------------------
 def summarize_and_generate_image(
     text: str,
-    model: str = "gpt-4o-mini",
+    model: Optional[str] = None,
     language: Optional[str] = None,
-    image_size: str = "1024x1024"
+    image_size: Optional[str] = None,
+    purpose: str = PURPOSE_PREVIEW,
+    with_image: bool = True
 ) -> Tuple[str, str, Optional[str]]:
     """
     뉴스 텍스트를 받아 제목, HTML 본문, 이미지 URL을 생성합니다.
+    모델과 생성 파라미터는 purpose(미리보기, 게시 등)와 스타일에 따라 라우팅되며,
+    model/image_size를 지정하면 라우트 값을 덮어씁니다.
+    with_image=False이면 이미지는 만들지 않고 글만 생성합니다.
+    프롬프트, 모델 응답, 최종 결과는 하나의 실행 ID로 아카이브에 남습니다.
     """
     if not text.strip():
         return "", "<p>요약할 텍스트가 없습니다.</p>", None
 
-    selected_lang = LANGUAGES.get(language, LANGUAGES["ko"])  # 기본값: 한국어
-    system_message_content = selected_lang["system_prompt"]
-    user_prompt_suffix_content = selected_lang["user_prompt_suffix"]
-    title_prefix = selected_lang["title_prefix"]
-    body_prefix = selected_lang["body_prefix"]
+    with archive_run():
+        title, html_summary, image_url = _summarize_and_generate_image(
+            text, model, language, image_size, purpose, with_image
+        )
+        archive_record(
+            KIND_ARTICLE,
+            {"title": title, "summary": html_summary, "image_url": image_url},
+            key=f"{purpose}:{language}",
+            meta={"corpus_hash": compute_content_hash(text)}
+        )
+    return title, html_summary, image_url
+
+
+def _summarize_and_generate_image(
+    text: str,
+    model: Optional[str],
+    language: Optional[str],
+    image_size: Optional[str],
+    purpose: str,
+    with_image: bool = True
+) -> Tuple[str, str, Optional[str]]:
+
+    style = get_style_registry().resolve(language)  # 기본값: 한국어
+    system_message_content = style.system_prompt
+    title_prefix = style.title_prefix
+    body_prefix = style.body_prefix
+
+    route = get_model_router().resolve(purpose, style.code)
+    if model:
+        route = replace(route, model=model, fallback_model=None)
+    if image_size:
+        route = replace(route, image_size=image_size)
+    if not with_image:
+        route = replace(route, image_model=None)
     
-    logger.info(f"🌐 '{selected_lang['name']}'로 기사를 작성합니다.")
+    logger.info(f"🌐 '{style.name}'로 기사를 작성합니다. (목적: {purpose}, 모델: {route.model})")
 
-    # 사용자 요청 프롬프트
-    full_user_prompt = f"{user_prompt_suffix_content}데이터:\n{text.strip()}"
+    # 사용자 요청 프롬프트 (요구사항 부분은 레지스트리에서 미리 조합됨)
+    corpus = text.strip()
+    full_user_prompt = style.build_user_prompt(corpus)
     now = datetime.datetime.now()
     default_title = f"{now.strftime('%Y-%m-%d')} News Summary"
 
+    image_prompt = None
     try:
-        # GPT로 뉴스 요약
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message_content},
-                {"role": "user", "content": full_user_prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1500
-        )
-        
-        full_response = response.choices[0].message.content.strip()
-        logger.info("✅ 글 생성 완료. 길이: %d자", len(full_response))
-        
-        # 제목 / 본문 분리
-        title_start = full_response.find(title_prefix)
-        body_start = full_response.find(body_prefix)
-        
-        if title_start != -1 and body_start != -1:
-            title_raw = full_response[title_start + len(title_prefix):body_start].strip()
-            summary_raw = full_response[body_start + len(body_prefix):].strip()
-            title = title_raw.strip('[]')
-            summary = summary_raw.strip('[]')
+        if get_settings().summarizer_output_mode == "json":
+            title, summary, image_prompt = _generate_structured_article(
+                route, purpose, style.code, system_message_content, full_user_prompt, default_title, corpus
+            )
         else:
-            logger.warning("⚠️ 제목/본문 구분 실패. 전체 응답을 본문으로 처리합니다.")
-            title = default_title
-            summary = full_response
+            title, summary = _generate_text_article(
+                route, purpose, style.code, system_message_content, full_user_prompt,
+                title_prefix, body_prefix, default_title, corpus
+            )
 
     except Exception as e:
         logger.error("❌ 글 생성 실패: %s", str(e))
@@ -250,31 +201,172 @@ def summarize_and_generate_image(
         html_summary = f"<div>{summary}</div>"
 
     # 이미지 생성
-    image_url = None
+    image_url = _generate_image(title, route, purpose, style.code, image_prompt)
+
+    return title, html_summary, image_url
+
+
+def _generate_text_article(
+    route: Route,
+    purpose: str,
+    style_code: str,
+    system_message_content: str,
+    full_user_prompt: str,
+    title_prefix: str,
+    body_prefix: str,
+    default_title: str,
+    corpus: Optional[str] = None
+) -> Tuple[str, str]:
+    """'제목: '/'본문: ' 구분자로 응답을 나누는 기존 텍스트 모드"""
+    # GPT로 뉴스 요약
+    full_response = _create_chat_completion(
+        route,
+        purpose,
+        style_code,
+        [
+            {"role": "system", "content": system_message_content},
+            {"role": "user", "content": full_user_prompt}
+        ],
+        corpus=corpus
+    )
+    logger.info("✅ 글 생성 완료. 길이: %d자", len(full_response))
+    
+    # 제목 / 본문 분리
+    title_start = full_response.find(title_prefix)
+    body_start = full_response.find(body_prefix)
+    
+    if title_start != -1 and body_start != -1:
+        title_raw = full_response[title_start + len(title_prefix):body_start].strip()
+        summary_raw = full_response[body_start + len(body_prefix):].strip()
+        return title_raw.strip('[]'), summary_raw.strip('[]')
+
+    logger.warning("⚠️ 제목/본문 구분 실패. 전체 응답을 본문으로 처리합니다.")
+    return default_title, full_response
+
+
+def _generate_structured_article(
+    route: Route,
+    purpose: str,
+    style_code: str,
+    system_message_content: str,
+    full_user_prompt: str,
+    default_title: str,
+    corpus: Optional[str] = None
+) -> Tuple[str, str, Optional[str]]:
+    """
+    JSON 스키마(title, html_body, image_prompt)로 응답을 받아 검증합니다.
+    누락되거나 잘린 필드는 원문 데이터 없이 짧은 후속 요청으로 해당 필드만 다시 받습니다.
+    본문이 전혀 없으면 원문과 함께 본문만 다시 요청하고, 그래도 없으면 ValueError를 발생시킵니다.
+    """
+    reply = _create_chat_completion(
+        route,
+        purpose,
+        style_code,
+        [
+            {"role": "system", "content": system_message_content + ARTICLE_FORMAT_INSTRUCTION},
+            {"role": "user", "content": full_user_prompt}
+        ],
+        response_format=ARTICLE_RESPONSE_FORMAT,
+        corpus=corpus
+    )
+    logger.info("✅ 글 생성 완료. 길이: %d자", len(reply))
+
+    fields, partial = parse_article_reply(reply)
+    # 제목과 이미지 프롬프트는 본문을 문맥으로 다시 요청하므로 본문을 먼저 채웁니다.
+    for field in sorted(missing_fields(fields), key=lambda name: name != "html_body"):
+        if field == "image_prompt" and not route.image_model:
+            # 이미지를 만들지 않는 라우트에서는 이미지 프롬프트를 다시 요청하지 않습니다.
+            continue
+        followup_corpus = None
+        if field == "html_body" and not partial.get(field):
+            followup_prompt = build_body_request_prompt(full_user_prompt, fields)
+            followup_corpus = corpus
+        else:
+            followup_prompt = build_followup_prompt(field, fields, partial.get(field))
+        if not followup_prompt:
+            continue
+        logger.info(f"🔁 누락된 '{field}' 필드만 다시 요청합니다.")
+        followup_route = route if field == "html_body" else replace(route, max_tokens=200)
+        value = _create_chat_completion(
+            followup_route,
+            purpose,
+            style_code,
+            [
+                {"role": "system", "content": system_message_content},
+                {"role": "user", "content": followup_prompt}
+            ],
+            corpus=followup_corpus
+        )
+        if field == "html_body" and partial.get(field):
+            # 끊긴 본문 뒤에 이어서 받은 내용을 붙입니다.
+            value = f"{partial[field]}{value}"
+        fields[field] = value.strip().strip('"')
+
+    if not fields.get("html_body"):
+        # JSON 응답 원문을 본문으로 게시하지 않도록 실패로 처리합니다.
+        raise ValueError("본문(html_body)을 생성하지 못했습니다.")
+    return fields.get("title") or default_title, fields["html_body"], fields.get("image_prompt")
+
+
+# -----------------------------
+# 기사 이미지 생성
+# -----------------------------
+def generate_news_image(
+    title: str,
+    image_size: Optional[str] = None,
+    purpose: str = PURPOSE_PUBLISH,
+    language: Optional[str] = None
+) -> Optional[str]:
+    """
+    기사 제목을 바탕으로 뉴스 사진 스타일의 이미지를 생성하고 URL을 반환합니다.
+    """
+    style_code = get_style_registry().resolve(language).code
+    route = get_model_router().resolve(purpose, style_code)
+    if image_size:
+        route = replace(route, image_size=image_size)
+    return _generate_image(title, route, purpose, style_code)
+
+
+def _generate_image(
+    title: str,
+    route: Route,
+    purpose: str,
+    style_code: str,
+    image_prompt: Optional[str] = None
+) -> Optional[str]:
+    if not route.image_model:
+        logger.info(f"🖼 '{purpose}' 라우트는 이미지를 생성하지 않습니다.")
+        return None
+
+    started = time.perf_counter()
     try:
-        image_prompt = f"{title} — realistic news photo style, high quality, 4k, photograph, news style"
-        img_response = client.images.generate(
-            model="dall-e-3",
+        base_prompt = image_prompt or title
+        image_prompt = f"{base_prompt} — realistic news photo style, high quality, 4k, photograph, news style"
+        img_response = get_openai_client().images.generate(
+            model=route.image_model,
             prompt=image_prompt,
-            size=image_size
+            size=route.image_size
         )
         image_url = img_response.data[0].url
+        get_model_router().stats.record(purpose, style_code, route.image_model, time.perf_counter() - started)
         logger.info("🖼 이미지 생성 완료: %s", image_url)
+        return image_url
     except Exception as e:
+        get_model_router().stats.record(purpose, style_code, route.image_model, time.perf_counter() - started, error=True)
         logger.error("❌ 이미지 생성 실패: %s", str(e))
-        image_url = None
-
-    return title, html_summary, image_url
+        return None
 
 
 # -----------------------------
 # 실행 테스트
 # -----------------------------
 if __name__ == "__main__":
+    from app.config import configure_logging
+    configure_logging()
     sample_text = "북한은 오늘 오전 단거리 탄도미사일을 동해상으로 발사했다고 한국 합참이 밝혔다. 이번 발사는 올해 들어 다섯 번째 무력 시위다."
     for lang_code in ["ko", "en", "ja"]:
         title, content, image = summarize_and_generate_image(sample_text, language=lang_code)
-        print(f"=== [{LANGUAGES[lang_code]['name']}] ===")
+        print(f"=== [{get_style_registry().display_name(lang_code)}] ===")
         print("제목:", title)
         print("본문:", content)
         print("이미지 URL:", image)
@@ -1,101 +1,45 @@
 # main.py
 import logging
+import os
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException, Request, Query
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta
 
-from app.fetcher import fetch_all_north_korea_trends
-from app.summarizer import summarize_and_generate_image
-from app.blog_uploader import upload_to_tistory
-# summarizer.py에서 LANGUAGES 딕셔너리 가져오기 (main.py에서 직접 정의하는 대신 모듈에서 가져오는 것이 더 좋습니다.)
-from app.summarizer import LANGUAGES as SUMMARIZER_LANGUAGES 
+from app.change_poller import poll_for_changes
+from app.circuit_breaker import breaker_states
+from app.config import configure_logging, get_settings
+from app.coordination import current_slot, get_job_claims
+from app.fetcher import get_last_good_store
+from app.summarizer import generate_news_image, summarize_and_generate_image
+from app.pregenerator import DraftStore, ensure_fresh_image, pending_languages, refresh_drafts
+from app.model_router import PURPOSE_PREVIEW, PURPOSE_PUBLISH, get_model_router
+from app.profiling import PipelineProfiler, ProfilerBusyError, artifact_path
+from app.publishers import first_published_url, publish_to_all
+from app.response_cache import ResponseCache
+from app.snapshot import SourceSnapshot, get_latest_snapshot, invalidate_latest_snapshot, take_snapshot
+from app.styles import get_style_registry, PUBLISH_DAY_OF_WEEK
 
 # -----------------------------
-# 언어 및 카테고리 설정
+# 언어(스타일) 및 카테고리 설정
 # -----------------------------
-# 언어 코드와 이름을 매핑하고 카테고리 ID를 추가합니다.
-# NOTE: 이 딕셔너리는 summarizer.py에 정의되어 있으므로, 
-# main.py에서는 import해서 사용하는 것이 좋습니다.
-# 여기서는 예시로 다시 정의합니다.
-SUMMARIZER_LANGUAGES = {
-    "ko": {
-        "name": "긍정적 관점",
-        "code": "ko",
-        "category_id": 1193166
-    },
-    "en": {
-        "name": "부정적 관점",
-        "code": "en",
-        "category_id": 1193919
-    },
-    "zh": {
-        "name": "미래 예측",
-        "code": "zh",
-        "category_id": 1193920
-    },
-    "ja": {
-        "name": "대외 관계",
-        "code": "ja",
-        "category_id": 1193921
-    },
-    "ru": {
-        "name": "카드 뉴스 형식",
-        "code": "ru",
-        "category_id": 1193922
-    },
-    "de": {
-        "name": "심층 분석",
-        "code": "de",
-        "category_id": 1193923
-    },
-    "fr": {
-        "name": "Q&A 형식",
-        "code": "fr",
-        "category_id": 1193924
-    },
-    "es": {
-        "name": "인포그래픽 설명",
-        "code": "es",
-        "category_id": 1193925
-    },
-    "ar": {
-        "name": "초보자용",
-        "code": "ar",
-        "category_id": 1193926
-    },
-    "hi": {
-        "name": "전문가용",
-        "code": "hi",
-        "category_id": 1193929
-    },
-    "vi": {
-        "name": "흥미 위주",
-        "code": "vi",
-        "category_id": 1193927
-    },
-    "id": {
-        "name": "결론 및 종합",
-        "code": "id",
-        "category_id": 1193928
-    },
-}
+# 프롬프트, 카테고리 ID, 게시 시간은 app/styles.py 레지스트리에서 한 번만 계산됩니다.
+style_registry = get_style_registry()
 
 # 지원하는 언어 코드를 리스트로 추출
-SUPPORTED_LANGUAGES: List[str] = list(SUMMARIZER_LANGUAGES.keys())
+SUPPORTED_LANGUAGES: List[str] = style_registry.codes
 # UI에 표시될 언어 이름을 리스트로 추출
-LANGUAGE_NAMES: List[str] = [lang['name'] for lang in SUMMARIZER_LANGUAGES.values()]
+LANGUAGE_NAMES: List[str] = style_registry.names
 
 # -----------------------------
 # 로거 설정
 # -----------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # -----------------------------
@@ -113,6 +57,99 @@ templates = Jinja2Templates(directory="static/templates")
 
 scheduler = AsyncIOScheduler()
 
+# -----------------------------
+# 사전 생성 초안 저장소
+# -----------------------------
+@lru_cache(maxsize=1)
+def get_draft_store() -> DraftStore:
+    """초안 저장소를 처음 사용할 때 생성합니다. (파일 로드를 import 시점에서 분리)"""
+    return DraftStore(get_settings().pregen_draft_path)
+
+
+def build_post_html(title: str, summary_html: str, image_url: Optional[str]) -> str:
+    """이미지 URL이 있으면 HTML 본문 앞에 이미지를 추가합니다."""
+    if image_url:
+        return f'<img src="{image_url}" alt="{title}" style="max-width:100%; height:auto;"><br>{summary_html}'
+    return summary_html
+
+# -----------------------------
+# /briefing/weekly 응답 캐시
+# -----------------------------
+@lru_cache(maxsize=1)
+def get_briefing_cache() -> ResponseCache:
+    """(언어 코드, 원문 스냅샷 해시) 단위의 응답 캐시를 처음 사용할 때 생성합니다."""
+    settings = get_settings()
+    return ResponseCache(maxsize=settings.briefing_cache_size, ttl_seconds=settings.briefing_cache_ttl_seconds)
+
+
+def build_weekly_briefing(snapshot: SourceSnapshot, language: str) -> Dict[str, Any]:
+    """
+    스냅샷으로 브리핑 응답을 생성합니다.
+    같은 스냅샷으로 만든 사전 생성 초안이 있으면 LLM 호출 없이 재사용합니다.
+    """
+    draft = get_draft_store().get(language)
+    if draft and draft.content_hash == snapshot.content_hash:
+        logger.info(f"🗂️ 사전 생성 초안 재사용 (언어 코드: {language})")
+        title, summary_html, image_url = draft.title, draft.summary_html, draft.image_url
+        # 응답은 최대 BRIEFING_CACHE_TTL_SECONDS 동안 캐시되므로, 그동안 만료되지 않을 이미지만 재사용합니다.
+        cache_ttl = timedelta(seconds=get_settings().briefing_cache_ttl_seconds)
+        if not image_url or draft.image_is_stale(margin=cache_ttl):
+            # 초안은 이미지 없이 저장되므로 미리보기 이미지만 새로 만듭니다.
+            image_url = generate_news_image(title, purpose=PURPOSE_PREVIEW, language=language)
+    else:
+        logger.info("✍️ 요약 및 이미지 생성 시작")
+        title, summary_html, image_url = summarize_and_generate_image(
+            snapshot.text, language=language, purpose=PURPOSE_PREVIEW
+        )
+
+    logger.info("📦 요약 완료 및 응답 준비 완료")
+    return {
+        "status": "success",
+        "title": title,
+        "summary": summary_html,
+        "image_url": image_url,
+        "language_used": style_registry.display_name(language)
+    }
+
+# -----------------------------
+# 프로파일링 파이프라인
+# -----------------------------
+def run_profiled_pipeline(language_code: str, publish: bool = False) -> Dict[str, Any]:
+    """
+    수집 → 요약 → HTML 조합 → (선택) 업로드 파이프라인을 한 스레드에서 실행하며
+    단계별 CPU 시간, 최대 메모리와 호출 스택을 기록합니다.
+    """
+    settings = get_settings()
+    label = f"{language_code} ({'publish' if publish else 'preview'})"
+    post_url = None
+    targets = []
+    with PipelineProfiler(settings.profile_output_dir, label) as profiler:
+        with profiler.stage("fetch"):
+            snapshot = take_snapshot()
+        with profiler.stage("summarize"):
+            title, summary_html, image_url = summarize_and_generate_image(
+                snapshot.text, language=language_code, purpose=PURPOSE_PUBLISH if publish else PURPOSE_PREVIEW
+            )
+        with profiler.stage("compose"):
+            full_summary_html = build_post_html(title, summary_html, image_url)
+        if publish and title != "[오류]":
+            with profiler.stage("upload"):
+                results = publish_to_all(title, full_summary_html, language_code, image_url)
+                post_url = first_published_url(results)
+                targets = [r.to_dict() for r in results]
+
+    result = profiler.summary()
+    result.update({"title": title, "url": post_url, "targets": targets, "image_url": image_url})
+    return result
+
+def log_publish_results(results) -> None:
+    """대상별 게시 결과를 요약하여 로그로 남깁니다."""
+    succeeded = sum(1 for r in results if r.ok)
+    if succeeded:
+        logger.info(f"✅ 게시 완료: {succeeded}/{len(results)}곳 성공")
+    else:
+        logger.error("❌ 게시 실패: 성공한 대상이 없습니다.")
+
 # -----------------------------
 # 스케줄링 작업 함수
 # -----------------------------
@@ -120,11 +157,24 @@ async def schedule_publish(language_code: str):
     """
     정기적으로 뉴스 데이터를 가져와 요약하고 블로그에 게시하는 함수
     """
-    language_name = SUMMARIZER_LANGUAGES.get(language_code, {}).get("name", "기본")
+    language_name = style_registry.display_name(language_code)
     logger.info(f"⏱️ 스케줄된 자동 게시 작업 시작... (언어: {language_name}, 코드: {language_code})")
+    if get_settings().pipeline_profile:
+        try:
+            result = await run_in_threadpool(run_profiled_pipeline, language_code, True)
+            logger.info(f"🔬 프로파일링된 게시 완료: {result['url']} (결과: {result['run_id']})")
+            return
+        except ProfilerBusyError:
+            # 다른 프로파일링(예: /debug/profile)이 실행 중이면 게시를 건너뛰지 않고 일반 파이프라인으로 진행합니다.
+            logger.warning("⚠️ 다른 프로파일링이 실행 중이어서 프로파일링 없이 게시합니다.")
+        except Exception as e:
+            logger.error(f"❌ 게시 실패: {str(e)}")
+            return
+
     try:
         logger.info("📰 북한 동향 수집 시작")
-        raw_data = await run_in_threadpool(fetch_all_north_korea_trends)
+        snapshot = await run_in_threadpool(take_snapshot)
+        raw_data = snapshot.text
 
         if not raw_data:
             logger.warning("⚠️ 북한 동향 데이터가 없어 스케줄 작업을 건너뜁니다.")
@@ -132,83 +182,183 @@ async def schedule_publish(language_code: str):
 
         logger.info(f"✍️ 요약 및 이미지 생성 시작 (언어: {language_code})")
         title, summary_html, image_url = await run_in_threadpool(
-            summarize_and_generate_image, raw_data, language=language_code
+            summarize_and_generate_image, raw_data, language=language_code, purpose=PURPOSE_PUBLISH
         )
         
-        if not title or not summary_html:
+        if not title or not summary_html or title == "[오류]":
             logger.error("❌ 요약 및 제목 생성 실패")
             return
 
         logger.info(f"🚀 블로그 업로드 시도 - 제목: {title}")
         
         # 이미지 URL이 있으면 HTML 본문에 추가
-        full_summary_html = summary_html
-        if image_url:
-            full_summary_html = f'<img src="{image_url}" alt="{title}" style="max-width:100%; height:auto;"><br>{summary_html}'
+        full_summary_html = build_post_html(title, summary_html, image_url)
         
-        # 수정: upload_to_tistory 함수 호출 시 language_code와 category_map 전달
-        category_map = {k: v['category_id'] for k, v in SUMMARIZER_LANGUAGES.items()}
-        post_url = await run_in_threadpool(
-            upload_to_tistory, title, f"{full_summary_html}", language_code, category_map
+        # 설정된 모든 게시 대상에 동시에 게시합니다.
+        results = await run_in_threadpool(
+            publish_to_all, title, full_summary_html, language_code, image_url
         )
-
-        if post_url:
-            logger.info(f"✅ 게시 성공: {post_url}")
-        else:
-            logger.error(f"❌ 게시 실패: post_url이 반환되지 않음")
+        log_publish_results(results)
         
     except Exception as e:
         logger.error(f"❌ 게시 실패: {str(e)}")
         pass
 
+def get_pregen_lead() -> timedelta:
+    """게시 시각 몇 시간 전부터 초안을 생성할지 (PREGEN_LEAD_HOURS)"""
+    return timedelta(hours=get_settings().pregen_lead_hours)
+
+async def refresh_pregenerated_drafts():
+    """
+    게시 시각이 PREGEN_LEAD_HOURS 이내로 다가온 언어의 초안을 최신 스냅샷으로 갱신합니다.
+    (이번 구간에 같은 원문으로 만든 초안이 있으면 재생성하지 않음)
+    """
+    logger.info("🗂️ 초안 사전 생성 작업 시작")
+    try:
+        refreshed = await run_in_threadpool(refresh_drafts, get_draft_store(), SUPPORTED_LANGUAGES, get_pregen_lead())
+        logger.info(f"✅ 초안 사전 생성 작업 완료: {refreshed}건 갱신")
+    except Exception as e:
+        logger.error(f"❌ 초안 사전 생성 실패: {str(e)}")
+
+async def poll_sources_and_generate():
+    """
+    출처의 가벼운 지문(totalCount, 목록 상위 행 해시)만 확인하고,
+    새 콘텐츠가 있거나 생성 구간에 들어온 언어의 초안이 아직 없을 때만 초안을 생성합니다. (사전 생성 모드 전용)
+    초안 파일은 모든 워커가 공유하므로 폴링을 선점한 워커 하나만 생성하면 됩니다.
+    """
+    try:
+        changed = await run_in_threadpool(poll_for_changes)
+    except Exception as e:
+        logger.error(f"❌ 출처 변경 확인 실패: {str(e)}")
+        return
+
+    if changed:
+        logger.info(f"🆕 변경된 출처: {', '.join(changed)}")
+        invalidate_latest_snapshot()
+    else:
+        pending = await run_in_threadpool(pending_languages, get_draft_store(), SUPPORTED_LANGUAGES, get_pregen_lead())
+        if not pending:
+            return
+        logger.info(f"🗓️ 생성 구간에 들어온 언어의 초안 생성: {', '.join(pending)}")
+    await refresh_pregenerated_drafts()
+
+async def publish_pregenerated(language_code: str):
+    """
+    미리 생성된 초안을 업로드만 수행하여 게시합니다.
+    초안이 없거나 PREGEN_DRAFT_MAX_AGE_HOURS보다 오래되었으면(갱신이 멈춘 경우 지난 주 초안의 중복 게시 방지)
+    기존 방식(schedule_publish)으로 대체합니다.
+    """
+    language_name = style_registry.display_name(language_code)
+    draft_store = get_draft_store()
+    draft = draft_store.get(language_code)
+    if not draft:
+        logger.warning(f"⚠️ '{language_name}' 초안이 없어 전체 파이프라인으로 게시합니다.")
+        await schedule_publish(language_code)
+        return
+    if draft.age() > timedelta(hours=get_settings().pregen_draft_max_age_hours):
+        logger.warning(f"⚠️ '{language_name}' 초안이 오래되어(생성 시각: {draft.generated_at}) 전체 파이프라인으로 게시합니다.")
+        await schedule_publish(language_code)
+        return
+
+    logger.info(f"⏱️ 사전 생성 초안 게시 시작 (언어: {language_name}, 생성 시각: {draft.generated_at})")
+    try:
+        draft = await run_in_threadpool(ensure_fresh_image, draft_store, draft)
+        results = await run_in_threadpool(
+            publish_to_all,
+            draft.title,
+            build_post_html(draft.title, draft.summary_html, draft.image_url),
+            language_code,
+            draft.image_url
+        )
+        log_publish_results(results)
+
+    except Exception as e:
+        logger.error(f"❌ 게시 실패: {str(e)}")
+
+async def run_exclusive(job, job_id: str, slot_minutes: int, *args):
+    """
+    여러 워커/레플리카 중 해당 구간(slot_minutes)의 작업을 선점한 하나만 job을 실행합니다.
+    나머지 워커는 작업을 건너뛰고 HTTP 요청 처리만 계속합니다.
+    """
+    slot = current_slot(slot_minutes)
+    claimed = await run_in_threadpool(get_job_claims().try_claim, job_id, slot)
+    if not claimed:
+        return
+    await job(*args)
+
 # -----------------------------
 # 애플리케이션 라이프사이클 이벤트
 # -----------------------------
-@app.on_event("startup")
-async def startup_event():
-    """애플리케이션 시작 시 스케줄러를 등록하고 실행합니다."""
-    logger.info("🚀 애플리케이션 시작 - 다국어 스케줄러 등록")
-    
-    # 시간대별 게시 스케줄 (KST 기준)
-    language_schedules = {
-        "ko": 21,    
-        "en": 23,    
-        "zh": 1,    
-        "ja": 3,    
-        "ru": 5,    
-        "de": 7,   
-        "fr": 9,   
-        "es": 11,   
-        "ar": 13,
-        "hi": 15,   
-        "vi": 17,
-        "id": 19,   
-    }
+def register_scheduled_jobs():
+    """스케줄러에 게시 작업을 등록하고 실행합니다."""
+    logger.info("🚀 다국어 스케줄러 등록")
+    settings = get_settings()
 
-    for language_code, hour in language_schedules.items():
-        if language_code in SUMMARIZER_LANGUAGES:
-            # 주간 스케줄링을 위한 `day_of_week` 파라미터를 추가했습니다.
-            # 이 예시에서는 매주 일요일에 게시하도록 설정합니다. (0=월요일, 6=일요일)
+    publish_job = schedule_publish
+    if settings.scheduler_mode == "pregenerate":
+        # 초안은 주기적으로 갱신하고, 게시 시간에는 업로드만 수행합니다.
+        publish_job = publish_pregenerated
+        if not settings.change_poller_enabled:
             scheduler.add_job(
-                schedule_publish,
-                'cron',
-                day_of_week='sun', 
-                hour=hour,
-                minute=0,
-                args=[language_code]
+                run_exclusive,
+                'interval',
+                minutes=settings.pregen_refresh_minutes,
+                next_run_time=datetime.now(),
+                args=[refresh_pregenerated_drafts, "refresh_drafts", settings.pregen_refresh_minutes]
             )
-            language_name = SUMMARIZER_LANGUAGES[language_code]['name']
-            logger.info(f"✅ 언어 '{language_name}' ({language_code}) 작업 등록: 매주 일요일 {hour}시 0분에 실행됩니다.")
-        else:
-            logger.warning(f"⚠️ 언어 코드 '{language_code}'는 지원되지 않아 스케줄링에서 제외됩니다.")
+            logger.info(f"🗂️ 사전 생성 모드 - {settings.pregen_refresh_minutes}분마다 초안을 갱신합니다.")
+
+    if settings.change_poller_enabled and settings.scheduler_mode != "pregenerate":
+        # direct 모드는 게시 시간에 생성하므로 변경 감지로 미리 생성할 대상이 없습니다.
+        logger.error("❌ CHANGE_POLLER_ENABLED는 SCHEDULER_MODE=pregenerate에서만 사용할 수 있습니다. 폴러를 등록하지 않습니다.")
+    elif settings.change_poller_enabled:
+        # 출처가 바뀐 경우에만 초안을 갱신합니다. (첫 확인은 항상 변경으로 간주)
+        scheduler.add_job(
+            run_exclusive,
+            'interval',
+            minutes=settings.poll_interval_minutes,
+            next_run_time=datetime.now(),
+            args=[poll_sources_and_generate, "poll_sources", settings.poll_interval_minutes]
+        )
+        logger.info(f"🔎 변경 감지 폴러 - {settings.poll_interval_minutes}분마다 출처 변경을 확인합니다.")
+
+    # 시간대별 게시 스케줄 (KST 기준)은 스타일 레지스트리에서 가져옵니다.
+    for language_code, hour in style_registry.schedule.items():
+        # 주간 스케줄링을 위한 `day_of_week` 파라미터를 추가했습니다.
+        # 이 예시에서는 매주 일요일에 게시하도록 설정합니다. (0=월요일, 6=일요일)
+        # 게시 작업은 워커 수와 관계없이 구간(1시간)당 한 번만 실행됩니다.
+        scheduler.add_job(
+            run_exclusive,
+            'cron',
+            day_of_week=PUBLISH_DAY_OF_WEEK,
+            hour=hour,
+            minute=0,
+            args=[publish_job, f"publish:{language_code}", 60, language_code]
+        )
+        language_name = style_registry.display_name(language_code)
+        logger.info(f"✅ 언어 '{language_name}' ({language_code}) 작업 등록: 매주 {PUBLISH_DAY_OF_WEEK} {hour}시 0분에 실행됩니다.")
 
     scheduler.start()
 
+@app.on_event("startup")
+async def startup_event():
+    """
+    애플리케이션 시작 시 스케줄러에 작업을 등록합니다.
+    등록에 실패하면(잘못된 설정 값 등) 스케줄러 없이 실행되지 않도록 오류를 남기고 시작을 중단합니다.
+    """
+    logger.info("🚀 애플리케이션 시작")
+    try:
+        register_scheduled_jobs()
+    except Exception:
+        logger.exception("❌ 스케줄러 작업 등록 실패")
+        raise
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 스케줄러를 종료합니다."""
     logger.info("👋 애플리케이션 종료 - 스케줄러 종료")
-    scheduler.shutdown()
+    if scheduler.running:
+        scheduler.shutdown()
 
 # -----------------------------
 # API 엔드포인트
@@ -222,14 +372,76 @@ def root(request: Request):
         "index.html", 
         {
             "request": request, 
-            "languages": SUMMARIZER_LANGUAGES,
+            "languages": dict(zip(SUPPORTED_LANGUAGES, LANGUAGE_NAMES)),
             "language_names": LANGUAGE_NAMES,
             "language_codes": SUPPORTED_LANGUAGES
         }
     )
 
+@app.get("/styles")
+def get_styles():
+    """
+    스타일(언어 코드)별 이름, 카테고리 ID, 게시 스케줄을 반환합니다. (웹 UI에서 사용)
+    """
+    return {"styles": style_registry.public_styles}
+
+@app.get("/routing/stats")
+def get_routing_stats():
+    """
+    목적별 모델 라우팅 설정과 라우트별 지연 시간, 토큰 사용량 통계를 반환합니다.
+    """
+    router = get_model_router()
+    return {"routes": router.describe(), "stats": router.stats.snapshot()}
+
+@app.get("/upstreams/status")
+def get_upstream_status():
+    """
+    출처별 차단기 상태와 마지막 정상 수집 이후 경과 시간(초)을 반환합니다.
+    """
+    return {"breakers": breaker_states(), "last_good_age_seconds": get_last_good_store().ages()}
+
+@app.get("/debug/profile")
+async def profile_pipeline(
+    language: Optional[str] = Query(
+        "ko",
+        description="프로파일링할 기사의 언어 코드",
+        enum=SUPPORTED_LANGUAGES
+    ),
+    publish: bool = Query(False, description="업로드 단계까지 실행할지 여부")
+):
+    """
+    파이프라인을 한 번 실행하며 프로파일링하고 단계별 결과와 다운로드 경로를 반환합니다.
+    ENABLE_DEBUG_ENDPOINTS가 켜져 있을 때만 사용할 수 있습니다.
+    """
+    if not get_settings().debug_endpoints_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    try:
+        result = await run_in_threadpool(run_profiled_pipeline, language, publish)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ 프로파일링 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    result["downloads"] = {
+        artifact: f"/debug/profile/{result['run_id']}/{artifact}" for artifact in result["artifacts"]
+    }
+    return result
+
+@app.get("/debug/profile/{run_id}/{artifact}")
+def download_profile(run_id: str, artifact: str):
+    """저장된 프로파일 결과 파일(summary, cprofile, flamegraph)을 내려받습니다."""
+    settings = get_settings()
+    if not settings.debug_endpoints_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    path = artifact_path(settings.profile_output_dir, run_id, artifact)
+    if not path:
+        raise HTTPException(status_code=404, detail="프로파일 결과를 찾을 수 없습니다.")
+    return FileResponse(path, filename=f"{run_id}-{os.path.basename(path)}")
+
 @app.get("/briefing/weekly")
 async def get_weekly_briefing(
+    request: Request,
     language: Optional[str] = Query(
         "ko",
         description="기사를 생성할 언어 코드",
@@ -238,30 +450,32 @@ async def get_weekly_briefing(
 ):
     """
     주간 북한 동향을 요약하여 반환합니다.
+    같은 언어와 같은 원문 스냅샷에 대한 결과는 메모리에서 바로 반환하며,
+    If-None-Match 헤더가 ETag와 일치하면 304를 반환합니다.
     """
     logger.info(f"✅ /briefing/weekly 요청 수신 (언어 코드: {language})")
     try:
-        logger.info("📰 북한 동향 수집 시작")
-        raw_data = await run_in_threadpool(fetch_all_north_korea_trends)
+        snapshot = await get_latest_snapshot(get_settings().snapshot_ttl_seconds)
 
-        if not raw_data:
+        if not snapshot.text:
             logger.warning("⚠️ 북한 동향 데이터 없음")
             raise HTTPException(status_code=404, detail="북한 동향 데이터를 불러오지 못했습니다.")
 
-        logger.info("✍️ 요약 및 이미지 생성 시작")
-        title, summary_html, image_url = await run_in_threadpool(
-            summarize_and_generate_image, raw_data, language=language
+        async def generate_briefing() -> Dict[str, Any]:
+            return await run_in_threadpool(build_weekly_briefing, snapshot, language)
+
+        entry = await get_briefing_cache().get_or_create(
+            (language, snapshot.content_hash),
+            generate_briefing,
+            cacheable=lambda payload: payload["title"] != "[오류]"
         )
 
-        logger.info("📦 요약 완료 및 응답 준비 완료")
-        return {
-            "status": "success",
-            "title": title,
-            "summary": summary_html,
-            "image_url": image_url,
-            "language_used": SUMMARIZER_LANGUAGES.get(language, {}).get("name", "기본")
-        }
+        if entry.matches(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=entry.headers)
+        return JSONResponse(entry.payload, headers=entry.headers)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 요약 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -277,11 +491,12 @@ async def publish_briefing(
     """
     주간 북한 동향을 요약하여 블로그에 게시합니다.
     """
-    language_name = SUMMARIZER_LANGUAGES.get(language, {}).get("name", "기본")
+    language_name = style_registry.display_name(language)
     logger.info(f"✅ /briefing/publish 요청 수신 (언어: {language_name}, 코드: {language})")
     try:
         logger.info("📰 북한 동향 수집 시작")
-        raw_data = await run_in_threadpool(fetch_all_north_korea_trends)
+        snapshot = await run_in_threadpool(take_snapshot)
+        raw_data = snapshot.text
 
         if not raw_data:
             logger.warning("⚠️ 북한 동향 데이터 없음")
@@ -289,30 +504,31 @@ async def publish_briefing(
 
         logger.info("✍️ 요약 및 이미지 생성 시작")
         title, summary_html, image_url = await run_in_threadpool(
-            summarize_and_generate_image, raw_data, language=language
+            summarize_and_generate_image, raw_data, language=language, purpose=PURPOSE_PUBLISH
         )
+        if title == "[오류]":
+            raise Exception("요약 및 제목 생성 실패")
 
         logger.info(f"🚀 블로그 업로드 시도 - 제목: {title}")
         
         # 이미지 URL이 있으면 HTML 본문에 추가
-        full_summary_html = summary_html
-        if image_url:
-            full_summary_html = f'<img src="{image_url}" alt="{title}" style="max-width:100%; height:auto;"><br>{summary_html}'
+        full_summary_html = build_post_html(title, summary_html, image_url)
         
-        # 수정: upload_to_tistory 함수 호출 시 language_code와 category_map 전달
-        category_map = {k: v['category_id'] for k, v in SUMMARIZER_LANGUAGES.items()}
-        post_url = await run_in_threadpool(
-            upload_to_tistory, title, f"{full_summary_html}", language, category_map
+        # 설정된 모든 게시 대상에 동시에 게시합니다.
+        results = await run_in_threadpool(
+            publish_to_all, title, full_summary_html, language, image_url
         )
+        post_url = first_published_url(results)
 
         if not post_url:
-            raise Exception("블로그 게시 실패")
+            raise Exception("블로그 게시 실패: " + "; ".join(f"{r.target}: {r.error}" for r in results))
 
         logger.info(f"✅ 게시 성공: {post_url}")
         return {
-            "status": "published",
+            "status": "published" if all(r.ok for r in results) else "partially_published",
             "title": title,
             "url": post_url,
+            "targets": [r.to_dict() for r in results],
             "image_url": image_url,
             "language_used": language_name
         }
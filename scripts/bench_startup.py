@@ -0,0 +1,94 @@
+"""
+애플리케이션 콜드 스타트(모듈 import) 시간을 측정하는 벤치마크 스크립트.
+
+`python -X importtime`의 출력(stderr)을 파싱하여 모듈별 누적 import 시간을 집계하고,
+새 인터프리터를 여러 번 띄워 전체 import 소요 시간의 중앙값을 보고합니다.
+
+사용 예:
+    python scripts/bench_startup.py                 # main 모듈 기준 5회 측정
+    python scripts/bench_startup.py --repeat 10 --top 15
+    python scripts/bench_startup.py --module app.summarizer --json
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 예: "import time:       123 |       4567 |   fastapi.routing"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """importtime 출력에서 모듈별 (self, cumulative) 마이크로초를 추출합니다."""
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            timings[module] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def run_once(module: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """새 인터프리터에서 모듈을 import하고 (전체 소요 시간(ms), 모듈별 시간)을 반환합니다."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"'{module}' import 실패:\n{result.stderr[-2000:]}")
+    return elapsed_ms, parse_importtime(result.stderr)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="콜드 스타트 import 시간 벤치마크")
+    parser.add_argument("--module", default="main", help="측정할 모듈 (기본값: main)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--top", type=int, default=10, help="누적 시간 상위 모듈 출력 수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    wall_times: List[float] = []
+    module_times: List[float] = []
+    last_timings: Dict[str, Tuple[int, int]] = {}
+    for _ in range(args.repeat):
+        elapsed_ms, timings = run_once(args.module)
+        wall_times.append(elapsed_ms)
+        module_times.append(timings.get(args.module, (0, 0))[1] / 1000)
+        last_timings = timings
+
+    top_modules = sorted(last_timings.items(), key=lambda kv: kv[1][1], reverse=True)[: args.top]
+    report = {
+        "module": args.module,
+        "repeat": args.repeat,
+        "process_wall_ms_median": round(statistics.median(wall_times), 1),
+        "import_cumulative_ms_median": round(statistics.median(module_times), 1),
+        "top_cumulative_ms": {name: round(cum / 1000, 1) for name, (_, cum) in top_modules},
+    }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f"📦 모듈: {report['module']} ({report['repeat']}회 측정)")
+    print(f"⏱️ 프로세스 전체 시간 중앙값: {report['process_wall_ms_median']} ms")
+    print(f"⏱️ '{args.module}' 누적 import 시간 중앙값: {report['import_cumulative_ms_median']} ms")
+    print(f"🔝 누적 import 시간 상위 {args.top}개 모듈:")
+    for name, cum_ms in report["top_cumulative_ms"].items():
+        print(f"   {cum_ms:>9.1f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+FastAPI 앱의 처리 용량을 측정하는 부하 테스트 스크립트.
+
+외부 의존성(수집, LLM/이미지 생성, 블로그 업로드)은 지정한 지연 시간만큼 sleep 하는
+스텁으로 대체하고, 앱을 별도 스레드의 uvicorn 서버로 띄운 뒤 동시 요청 수를 단계적으로
+늘려 가며 아래 지표를 측정합니다.
+
+  * 처리량(req/s), p50/p95/p99 지연 시간, 오류 수
+  * 서버 이벤트 루프 지연(loop lag)
+  * Starlette 스레드풀(run_in_threadpool) 사용 중인 슬롯 수와 대기열 길이
+
+사용 예:
+    python scripts/load_test.py                                   # /briefing/weekly, 캐시 없이
+    python scripts/load_test.py --concurrency 1,10,40,80 --duration 10
+    python scripts/load_test.py --endpoint publish --llm-delay 8 --threadpool-size 80
+    python scripts/load_test.py --warm --json                     # 캐시 적중 경로 측정
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# 서버 지표 샘플링 주기 (초)
+MONITOR_INTERVAL = 0.05
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(len(ordered) * pct / 100)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class ServerSamples:
+    """서버 이벤트 루프에서 수집한 지연 및 스레드풀 샘플"""
+    loop_lag: List[float] = field(default_factory=list)
+    threads_busy: List[int] = field(default_factory=list)
+    queue_depth: List[int] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def drain(self) -> "ServerSamples":
+        with self.lock:
+            drained = ServerSamples(self.loop_lag, self.threads_busy, self.queue_depth)
+            self.loop_lag, self.threads_busy, self.queue_depth = [], [], []
+        return drained
+
+
+def install_stubs(args: argparse.Namespace) -> None:
+    """
+    main 모듈의 외부 호출을 지연 시간만 흉내 내는 스텁으로 교체합니다.
+    반드시 설정(get_settings)이 처음 읽히기 전에 환경 변수를 지정해야 합니다.
+    """
+    workdir = tempfile.mkdtemp(prefix="loadtest-")
+    os.environ["PREGEN_DRAFT_PATH"] = os.path.join(workdir, "drafts.json")
+    os.environ["COORDINATION_DB_PATH"] = os.path.join(workdir, "coordination.sqlite3")
+    # 실제 아카이브(data/archive)를 오염시키지 않도록 임시 디렉터리에 기록합니다.
+    os.environ["ARCHIVE_DIR"] = os.path.join(workdir, "archive")
+    if not args.warm:
+        # 매 요청이 전체 파이프라인을 거치도록 응답 캐시를 끕니다.
+        os.environ["BRIEFING_CACHE_SIZE"] = "0"
+
+    import main
+    import app.snapshot
+    from fastapi.concurrency import run_in_threadpool
+    from app.publishers import PublishResult
+
+    counter = itertools.count()
+
+    def fake_fetch():
+        time.sleep(args.fetch_delay)
+        # 캐시를 끈 경우 요청마다 다른 스냅샷이 되도록 내용을 바꿉니다.
+        suffix = "" if args.warm else f" #{next(counter)}"
+        return f"[부하 테스트 데이터]\n스텁 본문{suffix}"
+
+    def fake_summarize(text, model=None, language=None, image_size=None, purpose=None, with_image=True):
+        time.sleep(args.llm_delay + args.image_delay)
+        return f"부하 테스트 제목 ({language})", "<div><p>부하 테스트 본문</p></div>", None
+
+    def fake_publish(title, html, language_code, image_url=None):
+        time.sleep(args.upload_delay)
+        return [PublishResult("stub", True, url=f"https://example.invalid/{language_code}/{next(counter)}")]
+
+    app.snapshot.fetch_all_north_korea_trends = fake_fetch
+    main.summarize_and_generate_image = fake_summarize
+    main.publish_to_all = fake_publish
+    if not args.warm:
+        # 스냅샷 재사용(및 동시 수집 병합)도 건너뛰고 요청마다 새로 수집합니다.
+        main.get_latest_snapshot = lambda max_age_seconds: run_in_threadpool(app.snapshot.take_snapshot)
+
+
+async def monitor_server(samples: ServerSamples, threadpool_size: Optional[int]) -> None:
+    """서버 루프 안에서 이벤트 루프 지연과 스레드풀 사용량을 주기적으로 기록합니다."""
+    import anyio.to_thread
+
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if threadpool_size:
+        limiter.total_tokens = threadpool_size
+
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(MONITOR_INTERVAL)
+        lag = loop.time() - started - MONITOR_INTERVAL
+        stats = limiter.statistics()
+        with samples.lock:
+            samples.loop_lag.append(max(0.0, lag))
+            samples.threads_busy.append(stats.borrowed_tokens)
+            samples.queue_depth.append(stats.tasks_waiting)
+
+
+def start_server(args: argparse.Namespace, samples: ServerSamples):
+    """앱을 별도 스레드의 이벤트 루프에서 uvicorn으로 실행합니다."""
+    import uvicorn
+    import main
+
+    config = uvicorn.Config(main.app, host="127.0.0.1", port=args.port, lifespan="off", log_level="warning")
+    server = uvicorn.Server(config)
+
+    async def serve():
+        monitor = asyncio.create_task(monitor_server(samples, args.threadpool_size))
+        try:
+            await server.serve()
+        finally:
+            monitor.cancel()
+
+    thread = threading.Thread(target=lambda: asyncio.run(serve()), name="loadtest-server", daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not server.started:
+        if time.time() > deadline:
+            raise RuntimeError("서버가 10초 안에 시작되지 않았습니다.")
+        time.sleep(0.05)
+    return thread, server
+
+
+async def run_stage(session, url: str, concurrency: int, duration: float) -> Dict[str, object]:
+    """동시 사용자 concurrency명이 duration초 동안 요청을 반복합니다."""
+    latencies: List[float] = []
+    errors = 0
+    stop_at = time.perf_counter() + duration
+
+    async def user():
+        nonlocal errors
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            try:
+                async with session.get(url) as response:
+                    await response.read()
+                    if response.status >= 400:
+                        errors += 1
+                        continue
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"latencies": latencies, "errors": errors, "elapsed": elapsed}
+
+
+def summarize_stage(concurrency: int, result: Dict[str, object], samples: ServerSamples) -> Dict[str, object]:
+    latencies = result["latencies"]
+    ms = lambda value: round(value * 1000, 1) if value is not None else None
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": result["errors"],
+        "throughput_rps": round(len(latencies) / result["elapsed"], 2),
+        "latency_p50_ms": ms(percentile(latencies, 50)),
+        "latency_p95_ms": ms(percentile(latencies, 95)),
+        "latency_p99_ms": ms(percentile(latencies, 99)),
+        "loop_lag_p99_ms": ms(percentile(samples.loop_lag, 99)),
+        "loop_lag_max_ms": ms(max(samples.loop_lag, default=None)),
+        "threads_busy_max": max(samples.threads_busy, default=0),
+        "threads_busy_mean": round(statistics.mean(samples.threads_busy), 1) if samples.threads_busy else 0,
+        "queue_depth_max": max(samples.queue_depth, default=0),
+    }
+
+
+def print_report(rows: List[Dict[str, object]], args: argparse.Namespace) -> None:
+    print(f"🎯 대상: /briefing/{args.endpoint} ({'캐시 사용' if args.warm else '캐시 없음'})")
+    print(
+        f"⏱️ 스텁 지연: 수집 {args.fetch_delay}s, LLM {args.llm_delay}s, "
+        f"이미지 {args.image_delay}s, 업로드 {args.upload_delay}s"
+    )
+    header = (
+        f"{'동시':>5} {'요청':>6} {'오류':>5} {'req/s':>8} {'p50ms':>9} {'p95ms':>9} {'p99ms':>9}"
+        f" {'lag99ms':>8} {'lagmax':>8} {'busy':>5} {'queue':>6}"
+    )
+    print(header)
+    for row in rows:
+        print(
+            f"{row['concurrency']:>5} {row['requests']:>6} {row['errors']:>5} {row['throughput_rps']:>8}"
+            f" {str(row['latency_p50_ms']):>9} {str(row['latency_p95_ms']):>9} {str(row['latency_p99_ms']):>9}"
+            f" {str(row['loop_lag_p99_ms']):>8} {str(row['loop_lag_max_ms']):>8}"
+            f" {row['threads_busy_max']:>5} {row['queue_depth_max']:>6}"
+        )
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, object]]:
+    import aiohttp
+
+    samples = ServerSamples()
+    server_thread, server = start_server(args, samples)
+    url = f"http://127.0.0.1:{args.port}/briefing/{args.endpoint}?language={args.language}"
+
+    rows = []
+    connector = aiohttp.TCPConnector(limit=0)
+    timeout = aiohttp.ClientTimeout(total=args.request_timeout)
+    try:
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            for concurrency in args.concurrency:
+                samples.drain()
+                result = await run_stage(session, url, concurrency, args.duration)
+                rows.append(summarize_stage(concurrency, result, samples.drain()))
+    finally:
+        server.should_exit = True
+        server_thread.join(timeout=10)
+    return rows
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="FastAPI 처리 용량 부하 테스트")
+    parser.add_argument("--endpoint", choices=["weekly", "publish"], default="weekly")
+    parser.add_argument("--language", default="ko")
+    parser.add_argument("--concurrency", default="1,5,10,20,40,80",
+                        type=lambda v: [int(x) for x in v.split(",")], help="단계별 동시 요청 수 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=5.0, help="단계별 측정 시간(초)")
+    parser.add_argument("--fetch-delay", type=float, default=0.5, help="수집 스텁 지연(초)")
+    parser.add_argument("--llm-delay", type=float, default=2.0, help="글 생성 스텁 지연(초)")
+    parser.add_argument("--image-delay", type=float, default=0.5, help="이미지 생성 스텁 지연(초)")
+    parser.add_argument("--upload-delay", type=float, default=0.3, help="업로드 스텁 지연(초)")
+    parser.add_argument("--threadpool-size", type=int, default=None, help="스레드풀 크기 (기본값: anyio 기본 40)")
+    parser.add_argument("--warm", action="store_true", help="스냅샷/응답 캐시를 켠 상태로 측정")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--request-timeout", type=float, default=300.0)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    install_stubs(args)
+    rows = asyncio.run(run(args))
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        print_report(rows, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,16 @@
 document.addEventListener('DOMContentLoaded', () => {
-    // FastAPI 템플릿에서 전달받은 스케줄 정보를 사용하지 않고, 
-    // main.py의 스케줄링 정보와 동일하게 하드코딩합니다.
-    const languageSchedules = {
-        "ko": { name: "긍정적 관점", hour: 21 },
-        "en": { name: "부정적 관점", hour: 23 },
-        "zh": { name: "미래 예측", hour: 1 },
-        "ja": { name: "대외 관계", hour: 3 },
-        "ru": { name: "카드 뉴스 형식", hour: 5 },
-        "de": { name: "심층 분석", hour: 7 },
-        "fr": { name: "Q&A 형식", hour: 9 },
-        "es": { name: "인포그래픽 설명", hour: 11 },
-        "ar": { name: "초보자용", hour: 13 },
-        "hi": { name: "전문가용", hour: 15 },
-        "vi": { name: "흥미 위주", hour: 17 },
-        "id": { name: "결론 및 종합", hour: 19 },
-    };
+    // 스케줄 정보는 서버의 스타일 레지스트리(/styles)에서 받아옵니다.
+    // { 언어 코드: { name, day, hour } } 형태로 보관합니다.
+    let languageSchedules = {};
+
+    // APScheduler cron의 day_of_week 값(mon~sun 또는 0=월요일~6=일요일)을 Date.getDay() 값으로 변환
+    const CRON_DAY_NAMES = ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'];
+    function toJsDay(dayOfWeek) {
+        if (typeof dayOfWeek === 'number' || /^\d$/.test(String(dayOfWeek))) {
+            return (Number(dayOfWeek) + 1) % 7;
+        }
+        return CRON_DAY_NAMES.indexOf(String(dayOfWeek).trim().toLowerCase().slice(0, 3));
+    }
 
     const languageSelect = document.getElementById('languageSelect');
     const nextPublishTimeElement = document.getElementById('next-publish-time');
@@ -24,7 +20,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
     /**
      * 다음 게시 시간을 계산하고 화면에 표시하는 함수
-     * main.py의 스케줄링 로직(매주 일요일, 특정 시간)을 반영합니다.
+     * 서버의 스케줄링 로직(매주 게시 요일, 특정 시간)을 반영합니다.
      */
     function updateNextPublishTime() {
         const selectedLangCode = languageSelect.value;
@@ -38,21 +34,17 @@ document.addEventListener('DOMContentLoaded', () => {
         const now = new Date();
         const currentDay = now.getDay(); // 0: 일요일, 1: 월요일, ...
         const currentHour = now.getHours();
-        const publishDay = 0; // 스케줄은 매주 일요일에 실행됨
+        const publishDay = publishInfo.day; // 서버 스케줄의 게시 요일
 
-        let nextPublishDate = new Date();
-
-        // 다음 게시일이 오늘(일요일)인지, 다음 주 일요일인지 판단
-        if (currentDay > publishDay || (currentDay === publishDay && currentHour >= publishInfo.hour)) {
-            // 오늘이 일요일이 아니거나, 오늘 일요일이고 게시 시간이 이미 지났다면 다음 주 일요일로
-            const daysUntilNextSunday = (7 - currentDay) % 7 || 7; // 오늘이 일요일이면 7일 추가
-            nextPublishDate.setDate(now.getDate() + daysUntilNextSunday);
-        } else {
-            // 오늘이 일요일이고 아직 게시 시간이 되지 않았다면 오늘로 설정
-            const daysUntilThisSunday = (publishDay - currentDay + 7) % 7;
-            nextPublishDate.setDate(now.getDate() + daysUntilThisSunday);
+        // 다음 게시 요일까지 남은 날 수 (오늘이 게시 요일이고 시간이 지났다면 다음 주)
+        let daysUntilPublish = (publishDay - currentDay + 7) % 7;
+        if (daysUntilPublish === 0 && currentHour >= publishInfo.hour) {
+            daysUntilPublish = 7;
         }
 
+        let nextPublishDate = new Date();
+        nextPublishDate.setDate(now.getDate() + daysUntilPublish);
+
         nextPublishDate.setHours(publishInfo.hour, 0, 0, 0);
 
         const days = ['일', '월', '화', '수', '목', '금', '토'];
@@ -66,8 +58,33 @@ document.addEventListener('DOMContentLoaded', () => {
     // 언어 선택 시 다음 게시 시간 업데이트
     languageSelect.addEventListener('change', updateNextPublishTime);
 
+    /**
+     * 서버에서 스타일별 게시 스케줄을 불러와 다음 게시 시간을 표시하는 함수
+     */
+    async function loadSchedules() {
+        try {
+            const response = await fetch('/styles');
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const data = await response.json();
+            languageSchedules = Object.fromEntries(
+                data.styles
+                    .map((style) => [style.code, {
+                        name: style.name,
+                        day: toJsDay(style.publish_day_of_week),
+                        hour: style.publish_hour
+                    }])
+                    .filter(([, info]) => info.day >= 0)
+            );
+        } catch (error) {
+            console.error('스케줄 정보를 불러오지 못했습니다:', error);
+        }
+        updateNextPublishTime();
+    }
+
     // 페이지 로드 시 초기 다음 게시 시간 표시
-    updateNextPublishTime();
+    loadSchedules();
 
     /**
      * API 호출 및 결과 표시를 위한 일반 함수
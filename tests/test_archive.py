@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from app import archive as archive_module
+from app import snapshot as snapshot_module
+from app.archive import KIND_API_RESPONSE, KIND_CORPUS, Archive, archive_record, archive_run
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    """archive_record가 임시 디렉터리의 아카이브에 기록하도록 합니다."""
+    instance = Archive(str(tmp_path / "archive"))
+    monkeypatch.setattr(archive_module, "get_archive", lambda: instance)
+    return instance
+
+
+def test_records_round_trip_across_segment_rollover(tmp_path):
+    archive = Archive(str(tmp_path), max_segment_bytes=200)
+    payloads = [os.urandom(120) for _ in range(4)]  # 압축되지 않는 크기라 레코드마다 새 세그먼트가 열립니다.
+    ids = [archive.append(KIND_API_RESPONSE, payload, key=f"k{i}") for i, payload in enumerate(payloads)]
+
+    segments = sorted(name for name in os.listdir(tmp_path) if name.endswith(".seg"))
+    assert len(segments) == 4
+    assert ids[0].startswith("000001-") and ids[-1].startswith("000004-")
+    assert [archive.read(record_id) for record_id in ids] == payloads
+
+
+def test_records_share_a_segment_until_it_is_full(tmp_path):
+    archive = Archive(str(tmp_path))
+    first = archive.append(KIND_CORPUS, "첫 번째".encode("utf-8"))
+    second = archive.append(KIND_CORPUS, "두 번째".encode("utf-8"))
+    entry = archive.get_entry(second)
+    assert first == "000001-0"
+    assert entry["segment"] == "segment-000001.seg" and entry["offset"] > 0
+    assert archive.read_text(first) == "첫 번째"
+    assert archive.read_text(second) == "두 번째"
+
+
+def test_another_instance_reads_appended_index_lines(tmp_path):
+    writer = Archive(str(tmp_path))
+    reader = Archive(str(tmp_path))
+    first = writer.append(KIND_CORPUS, b"one", key="a")
+    assert [entry["id"] for entry in reader.entries()] == [first]
+    second = writer.append(KIND_API_RESPONSE, b"two", key="b")
+    assert [entry["id"] for entry in reader.entries(kind=KIND_API_RESPONSE)] == [second]
+    assert reader.contains(KIND_API_RESPONSE, "b")
+    assert not reader.contains(KIND_CORPUS, "b")
+    assert reader.read(second) == b"two"
+
+
+def test_records_in_a_run_share_the_run_id(archive):
+    with archive_run() as run_id:
+        archive_record(KIND_API_RESPONSE, {"items": []}, key="api")
+        archive_record(KIND_CORPUS, "원문", key="hash")
+    assert {entry["run_id"] for entry in archive.entries()} == {run_id}
+
+
+def test_unchanged_snapshot_is_archived_once(archive, monkeypatch):
+    def fake_fetch():
+        archive_record(KIND_API_RESPONSE, {"items": ["a"]}, key="api")
+        return "같은 원문"
+
+    monkeypatch.setattr(snapshot_module, "fetch_all_north_korea_trends", fake_fetch)
+    first = snapshot_module.take_snapshot()
+    second = snapshot_module.take_snapshot()
+
+    assert first.content_hash == second.content_hash
+    assert [entry["kind"] for entry in archive.entries()] == [KIND_API_RESPONSE, KIND_CORPUS]
+    corpus = archive.entries(kind=KIND_CORPUS)[0]
+    assert corpus["key"] == first.content_hash
+    assert archive.entries(kind=KIND_API_RESPONSE)[0]["run_id"] == corpus["run_id"]
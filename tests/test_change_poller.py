@@ -0,0 +1,28 @@
+from app.change_poller import ChangePoller
+
+
+def _stub_fingerprints(monkeypatch, value):
+    monkeypatch.setattr(ChangePoller, "_api_fingerprint", lambda self, name, config, previous: {"value": value})
+    monkeypatch.setattr(ChangePoller, "_list_fingerprint", lambda self, previous: {"value": value})
+
+
+def test_unchanged_sources_are_not_reported_twice(tmp_path, monkeypatch):
+    _stub_fingerprints(monkeypatch, "1")
+    poller = ChangePoller(str(tmp_path / "poller_state.json"))
+    assert poller.poll()
+    assert poller.poll() == []
+
+
+def test_poll_reloads_state_saved_by_another_worker(tmp_path, monkeypatch):
+    path = str(tmp_path / "poller_state.json")
+    first_worker = ChangePoller(path)
+    second_worker = ChangePoller(path)
+
+    _stub_fingerprints(monkeypatch, "1")
+    assert first_worker.poll()
+    # 첫 번째 워커가 이미 처리한 변경을 두 번째 워커가 다시 보고하지 않습니다.
+    assert second_worker.poll() == []
+
+    _stub_fingerprints(monkeypatch, "2")
+    assert second_worker.poll()
+    assert first_worker.poll() == []
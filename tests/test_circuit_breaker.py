@@ -0,0 +1,80 @@
+import pytest
+
+from app import circuit_breaker
+from app.circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _open_breaker(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_seconds=60)
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_failure("timeout")
+    return breaker
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_seconds=60)
+    breaker.record_failure("timeout")
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request()
+    breaker.record_failure("timeout")
+    assert breaker.state == STATE_OPEN
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_seconds=60)
+    breaker.record_failure("timeout")
+    breaker.record_success()
+    breaker.record_failure("timeout")
+    assert breaker.state == STATE_CLOSED
+
+
+def test_open_breaker_rejects_until_reset(clock):
+    breaker = _open_breaker(clock)
+    assert not breaker.allow_request()
+    clock[0] += 59
+    assert not breaker.allow_request()
+    assert breaker.retry_after() == pytest.approx(1)
+
+
+def test_half_open_allows_single_probe(clock):
+    breaker = _open_breaker(clock)
+    clock[0] += 60
+    assert breaker.allow_request()
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow_request()
+
+
+def test_probe_success_closes(clock):
+    breaker = _open_breaker(clock)
+    clock[0] += 60
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request()
+
+
+def test_probe_failure_reopens(clock):
+    breaker = _open_breaker(clock)
+    clock[0] += 60
+    assert breaker.allow_request()
+    breaker.record_failure("timeout")
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_after() == pytest.approx(60)
+
+
+def test_release_frees_probe_without_changing_state(clock):
+    breaker = _open_breaker(clock)
+    clock[0] += 60
+    assert breaker.allow_request()
+    breaker.release()
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.allow_request()
@@ -0,0 +1,42 @@
+import threading
+from datetime import datetime
+
+from app.coordination import JobClaims, current_slot
+
+
+def test_current_slot_rounds_down_to_slot_start():
+    now = datetime(2026, 10, 18, 21, 37, 12).timestamp()
+    assert current_slot(60, now) == "2026-10-18T21:00"
+    assert current_slot(15, now) == "2026-10-18T21:30"
+
+
+def test_claim_succeeds_once_per_slot(tmp_path):
+    claims = JobClaims(str(tmp_path / "claims.sqlite3"))
+    assert claims.try_claim("publish:ko", "2026-10-18T21:00")
+    assert not claims.try_claim("publish:ko", "2026-10-18T21:00")
+    assert claims.try_claim("publish:ko", "2026-10-25T21:00")
+    assert claims.try_claim("publish:en", "2026-10-18T21:00")
+
+
+def test_claims_are_shared_through_the_database_file(tmp_path):
+    path = str(tmp_path / "claims.sqlite3")
+    assert JobClaims(path).try_claim("poll_sources", "2026-10-18T21:00")
+    assert not JobClaims(path).try_claim("poll_sources", "2026-10-18T21:00")
+
+
+def test_concurrent_workers_claim_exactly_once(tmp_path):
+    path = str(tmp_path / "claims.sqlite3")
+    workers = [JobClaims(path) for _ in range(8)]
+    results = []
+    barrier = threading.Barrier(len(workers))
+
+    def claim(worker):
+        barrier.wait()
+        results.append(worker.try_claim("refresh_drafts", "2026-10-18T21:00"))
+
+    threads = [threading.Thread(target=claim, args=(worker,)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(results) == [False] * 7 + [True]
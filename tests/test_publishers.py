@@ -0,0 +1,58 @@
+import json
+
+from app import publishers
+from app.publishers import Article, MarkdownPublisher, WebhookPublisher
+
+
+class FakeSettings:
+    def __init__(self, publish_targets):
+        self.publish_targets = publish_targets
+
+
+def _publishers_for(monkeypatch, publish_targets):
+    monkeypatch.setattr(publishers, "get_settings", lambda: FakeSettings(publish_targets))
+    publishers.get_publishers.cache_clear()
+    try:
+        return publishers.get_publishers()
+    finally:
+        publishers.get_publishers.cache_clear()
+
+
+def test_json_object_falls_back_to_default_target(monkeypatch, tmp_path):
+    result = _publishers_for(monkeypatch, json.dumps({"type": "markdown", "directory": str(tmp_path)}))
+    assert [publisher.kind for publisher in result] == ["tistory"]
+
+
+def test_invalid_items_are_skipped(monkeypatch, tmp_path):
+    result = _publishers_for(monkeypatch, json.dumps([
+        "markdown",
+        {"type": "unknown"},
+        {"type": "markdown", "directory": str(tmp_path)},
+    ]))
+    assert [type(publisher) for publisher in result] == [MarkdownPublisher]
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self._body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        if isinstance(self._body, Exception):
+            raise self._body
+        return self._body
+
+
+def test_webhook_success_does_not_depend_on_response_body(monkeypatch):
+    article = Article(title="제목", html="<p>본문</p>", language_code="ko")
+    publisher = WebhookPublisher("hook", "https://example.invalid/hook")
+    for body, expected in [
+        ({"url": "https://example.invalid/post/1"}, "https://example.invalid/post/1"),
+        ([{"url": "https://example.invalid/post/1"}], "https://example.invalid/hook"),
+        ("ok", "https://example.invalid/hook"),
+        (ValueError("not json"), "https://example.invalid/hook"),
+    ]:
+        monkeypatch.setattr(publisher.session, "post", lambda *args, body=body, **kwargs: FakeResponse(body))
+        assert publisher.publish(article) == expected
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+from app import snapshot as snapshot_module
+from app.response_cache import CachedResponse, ResponseCache
+from app.snapshot import SourceSnapshot
+
+
+def test_concurrent_requests_share_one_factory_call():
+    cache = ResponseCache(maxsize=4)
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"title": "제목"}
+
+    async def run():
+        return await asyncio.gather(*[cache.get_or_create("ko", factory) for _ in range(10)])
+
+    entries = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(entry is entries[0] for entry in entries)
+    assert cache.get("ko") is entries[0]
+
+
+def test_factory_error_reaches_every_waiter_and_is_not_cached():
+    cache = ResponseCache(maxsize=4)
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream")
+
+    async def run():
+        return await asyncio.gather(*[cache.get_or_create("ko", factory) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.get("ko") is None
+
+
+def test_uncacheable_payload_is_returned_but_not_stored():
+    cache = ResponseCache(maxsize=4)
+
+    async def factory():
+        return {"title": "[오류]"}
+
+    entry = asyncio.run(cache.get_or_create("ko", factory, cacheable=lambda payload: payload["title"] != "[오류]"))
+    assert entry.payload == {"title": "[오류]"}
+    assert cache.get("ko") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.response_cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(maxsize=4, ttl_seconds=60)
+    cache.put("ko", CachedResponse(payload={"title": "제목"}, created_at=now[0]))
+    now[0] += 59
+    assert cache.get("ko") is not None
+    now[0] += 2
+    assert cache.get("ko") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2)
+    for key in ("ko", "en"):
+        cache.put(key, CachedResponse(payload={"key": key}))
+    cache.get("ko")
+    cache.put("ja", CachedResponse(payload={"key": "ja"}))
+    assert cache.get("en") is None
+    assert cache.get("ko") is not None and cache.get("ja") is not None
+
+
+def test_etag_matching():
+    entry = CachedResponse(payload={"title": "제목"})
+    other = CachedResponse(payload={"title": "다른 제목"})
+    assert entry.etag != other.etag
+    assert entry.matches(entry.etag)
+    assert entry.matches(f"W/{entry.etag}")
+    assert entry.matches(f"{other.etag}, {entry.etag}")
+    assert entry.matches("*")
+    assert not entry.matches(other.etag)
+    assert not entry.matches(None)
+    assert not entry.matches("")
+
+
+def test_latest_snapshot_is_fetched_once_for_concurrent_requests(monkeypatch):
+    calls = []
+
+    def fake_take_snapshot():
+        calls.append(1)
+        time.sleep(0.05)
+        return SourceSnapshot(text="원문", content_hash="hash")
+
+    monkeypatch.setattr(snapshot_module, "take_snapshot", fake_take_snapshot)
+    snapshot_module.invalidate_latest_snapshot()
+
+    async def run():
+        snapshots = await asyncio.gather(*[snapshot_module.get_latest_snapshot(60) for _ in range(10)])
+        cached = await snapshot_module.get_latest_snapshot(60)
+        return snapshots, cached
+
+    snapshots, cached = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert cached is snapshots[0]
+    snapshot_module.invalidate_latest_snapshot()
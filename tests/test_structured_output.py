@@ -0,0 +1,41 @@
+from app.structured_output import build_followup_prompt, missing_fields, parse_article_reply
+
+
+def test_complete_json_reply():
+    fields, partial = parse_article_reply('{"title": " 제목 ", "html_body": "<p>본문</p>", "image_prompt": "a photo"}')
+    assert fields == {"title": "제목", "html_body": "<p>본문</p>", "image_prompt": "a photo"}
+    assert partial == {}
+    assert missing_fields(fields) == ()
+
+
+def test_truncated_reply_keeps_complete_fields_and_partial_value():
+    reply = '{"title": "제목", "html_body": "<p>첫 문단</p><p>둘째'
+    fields, partial = parse_article_reply(reply)
+    assert fields == {"title": "제목"}
+    assert partial == {"html_body": "<p>첫 문단</p><p>둘째"}
+    assert missing_fields(fields) == ("html_body", "image_prompt")
+
+
+def test_truncated_reply_decodes_escaped_strings():
+    reply = '{"title": "\\"따옴표\\" 제목", "html_body": "<p class=\\"lead\\">첫 줄\\n둘째 줄</p>", "image_prompt": "a ph'
+    fields, partial = parse_article_reply(reply)
+    assert fields["title"] == '"따옴표" 제목'
+    assert fields["html_body"] == '<p class="lead">첫 줄\n둘째 줄</p>'
+    assert partial == {"image_prompt": "a ph"}
+
+
+def test_truncated_inside_escape_sequence():
+    fields, partial = parse_article_reply('{"title": "제목", "html_body": "<p>끊긴 \\')
+    assert fields == {"title": "제목"}
+    assert partial["html_body"].startswith("<p>끊긴")
+
+
+def test_empty_values_count_as_missing():
+    fields, _ = parse_article_reply('{"title": "  ", "html_body": "<p>본문</p>", "image_prompt": ""}')
+    assert missing_fields(fields) == ("title", "image_prompt")
+
+
+def test_followup_prompt_for_cut_body_uses_partial_value():
+    prompt = build_followup_prompt("html_body", {"title": "제목"}, "<p>끊긴 본문")
+    assert "<p>끊긴 본문" in prompt
+    assert build_followup_prompt("html_body", {"title": "제목"}) is None
@@ -0,0 +1,87 @@
+import pytest
+
+from app import summarizer
+from app.model_router import Route
+
+CORPUS = "북한 동향 원문 데이터"
+USER_PROMPT = f"요구사항\n데이터:\n{CORPUS}"
+
+
+@pytest.fixture
+def completions(monkeypatch):
+    """_create_chat_completion을 미리 정한 응답을 차례로 반환하는 스텁으로 바꾸고 호출 내역을 기록합니다."""
+    calls = []
+    replies = []
+
+    def fake_create_chat_completion(route, purpose, style_code, messages, response_format=None, corpus=None):
+        calls.append({"route": route, "messages": messages, "response_format": response_format, "corpus": corpus})
+        return replies.pop(0)
+
+    monkeypatch.setattr(summarizer, "_create_chat_completion", fake_create_chat_completion)
+    return calls, replies
+
+
+def _generate(route=Route(model="test-model", max_tokens=1000)):
+    return summarizer._generate_structured_article(
+        route, "publish", "ko", "시스템", USER_PROMPT, "기본 제목", CORPUS
+    )
+
+
+def test_truncated_body_is_continued_without_corpus(completions):
+    calls, replies = completions
+    replies.extend([
+        '{"title": "제목", "html_body": "<p>첫 문단</p><p>둘째',
+        " 문단</p>",
+    ])
+
+    title, body, image_prompt = _generate()
+
+    assert (title, body, image_prompt) == ("제목", "<p>첫 문단</p><p>둘째 문단</p>", None)
+    assert len(calls) == 2
+    followup = calls[1]
+    assert followup["corpus"] is None
+    assert followup["response_format"] is None
+    assert all(CORPUS not in message["content"] for message in followup["messages"])
+    assert "끊긴 본문" in followup["messages"][-1]["content"]
+
+
+def test_only_missing_fields_are_requested(completions):
+    calls, replies = completions
+    replies.extend([
+        '{"html_body": "<p>본문</p>", "image_prompt": "a photo"}',
+        "새 제목",
+    ])
+
+    title, body, image_prompt = _generate(Route(model="test-model", max_tokens=1000, image_model="dall-e-3"))
+
+    assert (title, body, image_prompt) == ("새 제목", "<p>본문</p>", "a photo")
+    assert len(calls) == 2
+    assert calls[1]["route"].max_tokens == 200
+    assert "제목만 작성하세요" in calls[1]["messages"][-1]["content"]
+    assert CORPUS not in calls[1]["messages"][-1]["content"]
+
+
+def test_missing_body_is_requested_again_with_corpus(completions):
+    calls, replies = completions
+    replies.extend([
+        '{"title": "제목", "image_prompt": "a photo"}',
+        "<p>다시 받은 본문</p>",
+    ])
+
+    title, body, _ = _generate()
+
+    assert (title, body) == ("제목", "<p>다시 받은 본문</p>")
+    assert len(calls) == 2
+    assert calls[1]["corpus"] == CORPUS
+    assert CORPUS in calls[1]["messages"][-1]["content"]
+
+
+def test_reply_is_never_published_as_body(completions):
+    _, replies = completions
+    replies.extend([
+        '{"title": "제목", "image_prompt": "a photo"}',
+        "",
+    ])
+
+    with pytest.raises(ValueError):
+        _generate()